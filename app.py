@@ -1,18 +1,31 @@
 import streamlit as st
+import asyncio
+import bisect
 import os
 import shutil
 import tempfile
+import time
 from pathlib import Path
 from typing import Optional
 import atexit
 
-from file_utils import read_file_content, save_uploaded_file
+from file_utils import FileReadError, read_upload, read_uploads, save_uploaded_file
 from display_utils import (
     create_summary_table, display_file_tree, display_detailed_results,
     display_weight_controls, load_custom_css
 )
 from model_manager import ModelManager
 from resume_analysis_agent import ResumeAnalysisAgent
+from cascade import CascadeAnalyzer
+from llm_cache import LLMResultCache
+from extraction_cache import ExtractionCache, open_extraction_cache
+from ranking import rerank_results
+from token_accounting import summarize_token_usage
+from lexical_ranker import shortlist
+from tracing import configure_tracing
+
+# Minimum seconds between redraws of the live leaderboard during a batch
+LEADERBOARD_REFRESH_SECONDS = 0.5
 
 # Page configuration
 st.set_page_config(
@@ -22,15 +35,88 @@ st.set_page_config(
 )
 
 @st.cache_resource
-def initialize_agent(model_id: Optional[str] = None):
-    """Initialize and cache the analysis agent"""
+def get_model_manager() -> ModelManager:
+    """Model manager shared across reruns; it reloads config.yaml when the file changes"""
     model_manager = ModelManager()
+    configure_tracing(model_manager.get_tracing_config())
+    return model_manager
+
+@st.cache_resource
+def initialize_cache() -> Optional[LLMResultCache]:
+    """Open the persistent LLM result cache if enabled in config"""
+    cache_config = get_model_manager().get_cache_config()
+    if not cache_config.get('enabled', False):
+        return None
+    ttl_days = cache_config.get('ttl_days')
+    return LLMResultCache(
+        path=cache_config.get('path', '.cache/llm_results.sqlite'),
+        max_entries=cache_config.get('max_entries', 50000),
+        ttl_seconds=ttl_days * 24 * 3600 if ttl_days is not None else None
+    )
+
+@st.cache_resource
+def initialize_extraction_cache() -> Optional[ExtractionCache]:
+    """Open the extracted-text cache if enabled in config"""
+    return open_extraction_cache(get_model_manager().get_extraction_config())
+
+@st.cache_resource
+def initialize_agent(model_id: Optional[str] = None, fused: bool = False,
+                     section_routing: bool = False, job_digest: bool = False,
+                     gating_threshold: Optional[float] = None, execution: str = "parallel",
+                     max_in_flight: Optional[int] = None):
+    """Initialize and cache the analysis agent"""
+    model_manager = get_model_manager()
     if model_id is None:
         model_id = model_manager.get_default_model_id()
-    return ResumeAnalysisAgent(model_id)
+    return ResumeAnalysisAgent(
+        model_id,
+        fused=fused,
+        cache=initialize_cache(),
+        section_routing=section_routing,
+        job_digest=job_digest,
+        gating=build_gating(model_manager, gating_threshold),
+        execution=execution,
+        max_in_flight=max_in_flight
+    )
+
+def build_gating(model_manager: ModelManager, gating_threshold: Optional[float]) -> Optional[dict]:
+    """Gating policy from config with the threshold chosen in the sidebar, or None if disabled"""
+    if gating_threshold is None:
+        return None
+    return {**model_manager.get_gating_config(), "threshold": gating_threshold}
+
+@st.cache_resource
+def initialize_cascade(section_routing: bool = False, job_digest: bool = False,
+                       gating_threshold: Optional[float] = None):
+    """Initialize and cache the screening/premium model cascade from config"""
+    model_manager = get_model_manager()
+    return CascadeAnalyzer.from_config(
+        model_manager=model_manager,
+        cache=initialize_cache(),
+        section_routing=section_routing,
+        job_digest=job_digest,
+        gating=build_gating(model_manager, gating_threshold)
+    )
+
+async def run_batch_analysis(agent, job_description, resumes, weights, max_concurrency,
+                             on_result, on_error):
+    """Run a concurrent batch, handing each analysis to on_result as it completes
+
+    Resumes that fail after retries go to on_error; the rest of the batch continues.
+    """
+    async for resume_file, analysis in agent.analyze_batch(
+        job_description, resumes, weights, max_concurrency=max_concurrency, on_error=on_error
+    ):
+        on_result(resume_file, analysis)
+
+def handle_file_upload(persist_uploads: bool = False):
+    """Handle file uploads in sidebar
+
+    Uploads are kept in session state as bytes and parsed from memory; with
+    persist_uploads, a copy is also written to the session's temp directory.
+    """
+    uploads = st.session_state.uploads
 
-def handle_file_upload():
-    """Handle file uploads in sidebar"""
     # Job Posting Upload
     st.subheader("Upload Job Description")
     jd_file = st.file_uploader("Choose a job description file", 
@@ -38,11 +124,13 @@ def handle_file_upload():
                               key="jd_uploader")
     
     if jd_file is not None:
-        jd_dir = os.path.join(st.session_state.temp_dir, 'job_posting')
-        for file in os.listdir(jd_dir):
-            os.remove(os.path.join(jd_dir, file))
-        
-        save_uploaded_file(jd_file, jd_dir)
+        # getvalue() shares the upload's bytes rather than copying them
+        uploads['job_posting'] = {jd_file.name: jd_file.getvalue()}
+        if persist_uploads:
+            jd_dir = os.path.join(st.session_state.temp_dir, 'job_posting')
+            for file in os.listdir(jd_dir):
+                os.remove(os.path.join(jd_dir, file))
+            save_uploaded_file(jd_file, jd_dir)
         st.success(f"Job Description uploaded: {jd_file.name}")
 
 # Resume Upload
@@ -53,9 +141,10 @@ def handle_file_upload():
                                   key="resume_uploader")
     
     if resume_files:
-        resume_dir = os.path.join(st.session_state.temp_dir, 'resumes')
         for resume in resume_files:
-            save_uploaded_file(resume, resume_dir)
+            uploads['resumes'][resume.name] = resume.getvalue()
+            if persist_uploads:
+                save_uploaded_file(resume, os.path.join(st.session_state.temp_dir, 'resumes'))
         st.success(f"Uploaded {len(resume_files)} resume(s)")
 
 def cleanup_temp_files():
@@ -68,7 +157,10 @@ def main():
     st.markdown(load_custom_css(), unsafe_allow_html=True)
 
     # Initialize session state
-    if 'temp_dir' not in st.session_state:
+    if 'uploads' not in st.session_state:
+        st.session_state.uploads = {'job_posting': {}, 'resumes': {}}
+    persist_uploads = get_model_manager().get_extraction_config().get('persist_uploads', False)
+    if persist_uploads and 'temp_dir' not in st.session_state:
         st.session_state.temp_dir = tempfile.mkdtemp()
         os.makedirs(os.path.join(st.session_state.temp_dir, 'job_posting'), exist_ok=True)
         os.makedirs(os.path.join(st.session_state.temp_dir, 'resumes'), exist_ok=True)
@@ -79,7 +171,7 @@ def main():
 
         # Model Selection
         st.subheader("🤖 Model Selection")
-        model_manager = ModelManager()
+        model_manager = get_model_manager()
         model_names = model_manager.get_model_names()
         
         selected_model_id = st.selectbox(
@@ -107,9 +199,116 @@ def main():
                 </small>
             </div>
         """.format(pricing['input'], pricing['output']), unsafe_allow_html=True)
+
+        fused_mode = st.checkbox(
+            "Fused analysis (single call per resume)",
+            value=False,
+            help="Score all dimensions in one LLM call to cut token usage and latency"
+        )
+        section_routing = st.checkbox(
+            "Section-aware routing",
+            value=False,
+            disabled=fused_mode,
+            help="Send each analyzer only the resume sections it needs"
+        )
+        job_digest = st.checkbox(
+            "Digest job description",
+            value=False,
+            help="Condense the job description once into a requirements profile used in every prompt"
+        )
+        max_concurrency = st.number_input(
+            "Max concurrent resumes",
+            min_value=1,
+            max_value=50,
+            value=5,
+            step=1,
+            help="Number of resumes analyzed at the same time"
+        )
+        execution = st.selectbox(
+            "Dimension execution",
+            options=["parallel", "sequential", "bounded"],
+            disabled=fused_mode,
+            help="Run each resume's dimensions all at once, one at a time, or a few at a time; "
+                 "less fan-out per resume leaves more of the quota for other resumes"
+        )
+        max_in_flight = None
+        if execution == "bounded" and not fused_mode:
+            max_in_flight = int(st.number_input(
+                "Max dimensions in flight per resume",
+                min_value=1,
+                max_value=7,
+                value=3,
+                step=1
+            ))
+
+        # Model cascade, declared in config.yaml
+        cascade_config = model_manager.get_cascade_config()
+        cascade_enabled = False
+        if cascade_config:
+            cascade_enabled = st.checkbox(
+                "Model cascade",
+                value=cascade_config.get('enabled', False),
+                help="Screen all resumes with the cheapest model and re-analyze "
+                     "contenders with the premium model set in config.yaml "
+                     "(overrides the model selection above)"
+            )
+
+        # Early-exit gating, declared in config.yaml
+        gating_config = model_manager.get_gating_config()
+        gating_threshold = None
+        if gating_config:
+            gating_enabled = st.checkbox(
+                "Early-exit gating",
+                value=gating_config.get('enabled', False),
+                disabled=fused_mode,
+                help="Analyze {} first and skip the remaining components for resumes "
+                     "scoring below the threshold".format(", ".join(gating_config.get('first_tier', [])))
+            )
+            if gating_enabled and not fused_mode:
+                gating_threshold = float(st.slider(
+                    "Gating threshold",
+                    min_value=0,
+                    max_value=100,
+                    value=int(gating_config.get('threshold', 40))
+                ))
+
+        # Cache statistics
+        result_cache = initialize_cache()
+        if result_cache is not None:
+            cache_stats = result_cache.stats()
+            st.caption(
+                f"Result cache: {cache_stats['entries']:,} entries, "
+                f"{cache_stats['hits']:,} hits / {cache_stats['misses']:,} misses"
+            )
         
         st.markdown("---")
 
+        # Lexical pre-screening
+        st.subheader("🔎 Pre-screening")
+        prescreen_enabled = st.checkbox(
+            "Shortlist resumes lexically before LLM analysis",
+            value=False,
+            help="Rank resumes against the job description with a local BM25 index "
+                 "and only send the best matches to the LLM"
+        )
+        prescreen_top_k = st.number_input(
+            "Resumes to keep",
+            min_value=1,
+            value=50,
+            step=10,
+            disabled=not prescreen_enabled
+        )
+        prescreen_min_score = st.slider(
+            "Minimum lexical score",
+            min_value=0,
+            max_value=100,
+            value=0,
+            disabled=not prescreen_enabled,
+            help="Relative to the best-matching resume (100)"
+        )
+
+        st.markdown("---")
+
         # Weight controls
         weights_valid = display_weight_controls()
 
@@ -117,7 +316,7 @@ def main():
 
         # File Management
         st.title("📁 File Management")
-        handle_file_upload()
+        handle_file_upload(persist_uploads)
         
         # Display file structure
         st.subheader("Current Files")
@@ -126,9 +325,11 @@ def main():
         # Clear files button
         if st.button("Clear All Files", type="secondary"):
             for dir_name in ['job_posting', 'resumes']:
-                dir_path = os.path.join(st.session_state.temp_dir, dir_name)
-                for file in os.listdir(dir_path):
-                    os.remove(os.path.join(dir_path, file))
+                st.session_state.uploads[dir_name] = {}
+                if 'temp_dir' in st.session_state:
+                    dir_path = os.path.join(st.session_state.temp_dir, dir_name)
+                    for file in os.listdir(dir_path):
+                        os.remove(os.path.join(dir_path, file))
             st.success("All files cleared!")
             st.rerun()
 
@@ -138,20 +339,34 @@ def main():
 
     # Initialize analysis agent
     try:
-        analysis_agent = initialize_agent(model_id=selected_model_id)
+        if cascade_enabled:
+            analysis_agent = initialize_cascade(
+                section_routing=section_routing,
+                job_digest=job_digest,
+                gating_threshold=gating_threshold
+            )
+        else:
+            analysis_agent = initialize_agent(
+                model_id=selected_model_id,
+                fused=fused_mode,
+                section_routing=section_routing,
+                job_digest=job_digest,
+                gating_threshold=gating_threshold,
+                execution="parallel" if fused_mode else execution,
+                max_in_flight=max_in_flight
+            )
     except Exception as e:
         st.error(f"Error initializing analysis agent: {str(e)}")
         return
 
     # Check if files are uploaded
-    jd_path = os.path.join(st.session_state.temp_dir, 'job_posting')
-    resume_path = os.path.join(st.session_state.temp_dir, 'resumes')
+    uploads = st.session_state.uploads
     
-    if not os.listdir(jd_path):
+    if not uploads['job_posting']:
         st.warning("Please upload a job description first.")
         return
     
-    if not os.listdir(resume_path):
+    if not uploads['resumes']:
         st.warning("Please upload some resumes to analyze.")
         return
 
@@ -164,6 +379,10 @@ def main():
 
     if clear_analysis:
         st.session_state.analyzed_results = None
+        st.session_state.score_frame = None
+        st.session_state.ranked_weights = None
+        st.session_state.failed_resumes = {}
+        st.session_state.analysis_total = 0
         st.rerun()
 
     if analyze_clicked:
@@ -173,67 +392,180 @@ def main():
                 return
 
             # Read job description
-            jd_file = os.listdir(jd_path)[0]
-            job_description = read_file_content(os.path.join(jd_path, jd_file))
+            extraction_config = get_model_manager().get_extraction_config()
+            jd_file, jd_data = next(iter(uploads['job_posting'].items()))
+            try:
+                job_description = read_upload(
+                    jd_file,
+                    jd_data,
+                    cache=initialize_extraction_cache(),
+                    pdf_backend=extraction_config.get('pdf_backend', 'auto'),
+                    limits=extraction_config.get('limits'),
+                    on_truncated=lambda name, limit: st.info(
+                        f"The job description was cut short at its {limit} limit."
+                    )
+                )
+            except FileReadError as e:
+                st.error(str(e))
+                job_description = None
             
             if not job_description:
                 st.error("Could not read job description file.")
                 return
 
-            # Process all resumes
-            analyzed_results = []
+            # Read all resumes from memory, parsing in worker processes and reusing cached text
+            truncated = {}
+            with st.spinner("Reading resumes..."):
+                contents = read_uploads(
+                    uploads['resumes'],
+                    cache=initialize_extraction_cache(),
+                    max_workers=extraction_config.get('workers'),
+                    on_error=lambda name, e: st.error(f"{name}: {e}"),
+                    pdf_backend=extraction_config.get('pdf_backend', 'auto'),
+                    limits=extraction_config.get('limits'),
+                    on_truncated=truncated.__setitem__
+                )
+            resumes = {name: content for name, content in contents.items() if content}
+
+            # Optionally keep only the best lexical matches for LLM analysis
+            lexical_scores = {}
+            if prescreen_enabled:
+                total_resumes = len(resumes)
+                lexical_scores = dict(shortlist(
+                    resumes,
+                    job_description,
+                    top_k=int(prescreen_top_k),
+                    min_score=prescreen_min_score or None
+                ))
+                resumes = {name: resumes[name] for name in lexical_scores}
+                st.info(f"Pre-screening kept {len(resumes)} of {total_resumes} resumes for analysis.")
+
+            # Analyze resumes concurrently. Results go straight into session state,
+            # so a stopped or interrupted run keeps everything completed so far
+            st.session_state.analyzed_results = analyzed_results = []
+            st.session_state.failed_resumes = failed_resumes = {}
+            st.session_state.analysis_total = len(resumes)
+            st.session_state.score_frame = None
+            st.session_state.ranked_weights = None
+
             progress_text = st.empty()
             progress_bar = st.progress(0)
-            
-            resume_files = os.listdir(resume_path)
-            for idx, resume_file in enumerate(resume_files):
-                progress_text.text(f"Analyzing resume {idx + 1} of {len(resume_files)}...")
-                
-                # Read resume content
-                resume_content = read_file_content(os.path.join(resume_path, resume_file))
-                if resume_content:
-                    # Analyze resume with custom weights
-                    analysis = analysis_agent.analyze_resume(
-                        job_description=job_description,
-                        resume_content=resume_content,
-                        weights=st.session_state.analysis_weights
-                    )
-                    
-                    # Add file information
-                    analysis['file_name'] = resume_file
-                    analysis['file_path'] = os.path.join(resume_path, resume_file)
-                    
-                    analyzed_results.append(analysis)
-                
-                # Update progress
-                progress_bar.progress((idx + 1) / len(resume_files))
+            progress_text.text(f"Analyzing {len(resumes)} resume(s)...")
+            leaderboard = st.empty()
+            # Negated total scores, parallel to analyzed_results, keep it sorted best first
+            sort_keys = []
+            last_refresh = 0.0
+
+            def refresh_leaderboard():
+                nonlocal last_refresh
+                last_refresh = time.monotonic()
+                leaderboard.dataframe(
+                    create_summary_table(analyzed_results),
+                    hide_index=True,
+                    use_container_width=True
+                )
+
+            def on_result(resume_file, analysis):
+                # Add file information
+                analysis['file_name'] = resume_file
+                if resume_file in truncated:
+                    analysis['truncated'] = truncated[resume_file]
+                if resume_file in lexical_scores:
+                    analysis['lexical_score'] = lexical_scores[resume_file]
+                position = bisect.bisect_right(sort_keys, -analysis['total_score'])
+                sort_keys.insert(position, -analysis['total_score'])
+                analyzed_results.insert(position, analysis)
+
+                # Update progress, redrawing the leaderboard at most every refresh interval
+                progress_text.text(f"Analyzed {len(analyzed_results)} of {len(resumes)} resumes...")
+                progress_bar.progress((len(analyzed_results) + len(failed_resumes)) / len(resumes))
+                if time.monotonic() - last_refresh >= LEADERBOARD_REFRESH_SECONDS:
+                    refresh_leaderboard()
+
+            def on_error(resume_file, error):
+                failed_resumes[resume_file] = str(error)
+                progress_bar.progress((len(analyzed_results) + len(failed_resumes)) / len(resumes))
+
+            asyncio.run(run_batch_analysis(
+                analysis_agent,
+                job_description,
+                resumes,
+                st.session_state.analysis_weights,
+                int(max_concurrency),
+                on_result,
+                on_error
+            ))
             
             progress_text.empty()
             progress_bar.empty()
+            leaderboard.empty()
+
+            concurrency = getattr(analysis_agent, 'concurrency', None)
+            if concurrency is not None:
+                stats = concurrency.stats()
+                st.caption(
+                    f"Adaptive concurrency: window {stats['window']}, peak {stats['peak_in_flight']} "
+                    f"calls in flight, {stats['congestion_events']} congestion event(s)"
+                )
+            hedger = getattr(analysis_agent, 'hedger', None)
+            if hedger is not None:
+                stats = hedger.stats()
+                st.caption(
+                    f"Hedged requests: {stats['hedges']} of {stats['calls']} calls, "
+                    f"{stats['hedge_wins']} won by the hedge"
+                )
 
-            # Sort results and store in session state
-            analyzed_results.sort(key=lambda x: x['total_score'], reverse=True)
+            # Sort results and store them with their raw score matrix in session state
+            analyzed_results, score_frame = rerank_results(
+                analyzed_results, st.session_state.analysis_weights
+            )
             st.session_state.analyzed_results = analyzed_results
+            st.session_state.score_frame = score_frame
+            st.session_state.ranked_weights = dict(st.session_state.analysis_weights)
 
         except Exception as e:
             st.error(f"An error occurred during analysis: {str(e)}")
             raise
 
+    for resume_file, error in st.session_state.get('failed_resumes', {}).items():
+        st.warning(f"Could not analyze {resume_file}: {error}")
+
     # Display results if available in session state
     if hasattr(st.session_state, 'analyzed_results') and st.session_state.analyzed_results:
+        finished = len(st.session_state.analyzed_results) + len(st.session_state.get('failed_resumes', {}))
+        if finished < st.session_state.get('analysis_total', 0):
+            st.info(
+                f"Showing partial results: the last run stopped after {finished} of "
+                f"{st.session_state.analysis_total} resumes."
+            )
+
+        # Re-rank locally when the weights changed since the last ranking
+        if weights_valid and st.session_state.get('ranked_weights') != st.session_state.analysis_weights:
+            st.session_state.analyzed_results, st.session_state.score_frame = rerank_results(
+                st.session_state.analyzed_results,
+                st.session_state.analysis_weights,
+                st.session_state.get('score_frame')
+            )
+            st.session_state.ranked_weights = dict(st.session_state.analysis_weights)
+
         analyzed_results = st.session_state.analyzed_results
         
-        # Display token usage
-        if 'token_usage' in analyzed_results[0]:
+        # Display token usage and cost for the whole batch
+        batch_usage = summarize_token_usage(analyzed_results)
+        if batch_usage['resumes']:
             st.markdown("""
                 <div class="token-info">
                     <h4>💰 Token Usage</h4>
+                    <div>Resumes: {:,}</div>
                     <div>Input Tokens: {:,}</div>
                     <div>Output Tokens: {:,}</div>
+                    <div>Estimated Cost: ${:.4f}</div>
                 </div>
             """.format(
-                analyzed_results[0]['token_usage']['input_tokens'],
-                analyzed_results[0]['token_usage']['output_tokens']
+                batch_usage['resumes'],
+                batch_usage['input_tokens'],
+                batch_usage['output_tokens'],
+                batch_usage['cost']
             ), unsafe_allow_html=True)
         
         # Display summary table
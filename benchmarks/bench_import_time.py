@@ -0,0 +1,51 @@
+"""Measure cold import time of the app's modules in fresh interpreters.
+
+Usage:
+    python -m benchmarks.bench_import_time --repeat 5
+
+Each module is imported in a new process, so nothing is shared between
+measurements. Also reports which heavy dependencies each import pulls in.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+MODULES = ["file_utils", "model_manager", "resume_analysis_agent", "run_batch"]
+HEAVY_DEPENDENCIES = ["streamlit", "langchain_google_genai", "langchain_openai"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str) -> dict:
+    """Import module in a fresh interpreter, returning its import time and heavy dependencies loaded"""
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", PROBE.format(module=module, heavy=HEAVY_DEPENDENCIES)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh imports per module")
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    args = parser.parse_args()
+
+    print(f"{'Module':<24} {'median':>9} {'min':>9}  heavy dependencies loaded")
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        seconds = [run["seconds"] for run in runs]
+        loaded = ", ".join(runs[0]["loaded"]) or "-"
+        print(f"{module:<24} {statistics.median(seconds) * 1000:7.0f}ms {min(seconds) * 1000:7.0f}ms  {loaded}")
+
+
+if __name__ == "__main__":
+    main()
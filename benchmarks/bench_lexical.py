@@ -0,0 +1,76 @@
+"""Benchmark BM25 index build and query time on a synthetic resume corpus.
+
+Usage:
+    python -m benchmarks.bench_lexical --resumes 10000
+
+Runs entirely offline on generated text.
+"""
+import argparse
+import random
+import time
+
+from lexical_ranker import BM25Index, shortlist
+
+SKILLS = [
+    "python", "java", "c++", "c#", "sql", "spark", "kafka", "aws", "azure", "gcp", "docker",
+    "kubernetes", "terraform", "react", "node.js", "pandas", "pytorch", "tensorflow", "airflow",
+    "tableau", "excel", "salesforce", "sap", "jira", "agile", "scrum", "leadership", "mentoring",
+]
+FILLER = (
+    "responsible managed delivered built designed led improved team project stakeholders "
+    "customers reporting analysis pipeline platform service migration performance quality "
+    "process strategy roadmap budget revenue growth operations support training hiring"
+).split()
+
+JOB_DESCRIPTION = (
+    "Senior data engineer. Required: Python, SQL, Spark, Kafka and Airflow on AWS. "
+    "Experience with Docker, Kubernetes and Terraform. Leadership and mentoring of a small team."
+)
+
+
+def synthetic_resume(rng: random.Random, words: int = 450, rare_words: int = 40) -> str:
+    """A resume-like bag of filler words with a random handful of skills
+
+    rare_words random strings stand in for names, employers and places, so the
+    vocabulary grows with the corpus as it would for real resumes.
+    """
+    skills = rng.sample(SKILLS, rng.randint(3, 12))
+    rare = ["".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=7)) for _ in range(rare_words)]
+    tokens = [rng.choice(FILLER) for _ in range(words)] + skills * rng.randint(1, 4) + rare
+    rng.shuffle(tokens)
+    return " ".join(tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=10000, help="Corpus size")
+    parser.add_argument("--queries", type=int, default=50, help="Queries to average over")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [synthetic_resume(rng) for _ in range(args.resumes)]
+
+    start = time.perf_counter()
+    index = BM25Index().fit(corpus)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.queries):
+        index.score(JOB_DESCRIPTION)
+    query_time = (time.perf_counter() - start) / args.queries
+
+    documents = {f"resume_{i}": text for i, text in enumerate(corpus)}
+    start = time.perf_counter()
+    top = shortlist(documents, JOB_DESCRIPTION, top_k=100)
+    shortlist_time = time.perf_counter() - start
+
+    print(f"Resumes: {args.resumes:,}  Vocabulary: {len(index.vocabulary):,}  "
+          f"Stored terms: {index.weights.nnz:,}")
+    print(f"Index build:         {build_time * 1000:8.1f} ms")
+    print(f"Query (per JD):      {query_time * 1000:8.2f} ms")
+    print(f"Build + shortlist:   {shortlist_time * 1000:8.1f} ms  (top {len(top)} kept)")
+
+
+if __name__ == "__main__":
+    main()
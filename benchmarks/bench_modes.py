@@ -0,0 +1,103 @@
+"""Compare fused, parallel, sequential and bounded analysis modes on tokens and wall time.
+
+Usage:
+    python -m benchmarks.bench_modes --jd path/to/job.pdf --resumes path/to/resumes/
+
+Each mode analyzes every resume in the directory against the same job
+description. This calls the configured LLM provider, so it is billed.
+"""
+import argparse
+import os
+import time
+from typing import Dict, List
+
+from file_utils import FileReadError, read_file_content
+from resume_analysis_agent import ResumeAnalysisAgent
+
+
+def build_agents(model_id: str, modes: List[str], max_in_flight: int) -> Dict[str, object]:
+    """Create one agent per requested mode"""
+    factories = {
+        "fused": lambda: ResumeAnalysisAgent(model_id, fused=True),
+        "parallel": lambda: ResumeAnalysisAgent(model_id),
+        "sequential": lambda: ResumeAnalysisAgent(model_id, execution="sequential"),
+        "bounded": lambda: ResumeAnalysisAgent(model_id, execution="bounded", max_in_flight=max_in_flight),
+    }
+    return {mode: factories[mode]() for mode in modes}
+
+
+def run_mode(agent, job_description: str, resumes: Dict[str, str]) -> Dict:
+    """Analyze all resumes with one agent and collect tokens and timings"""
+    input_tokens = 0
+    output_tokens = 0
+    cost = 0.0
+    scores = {}
+    per_resume = []
+
+    start = time.perf_counter()
+    for name, content in resumes.items():
+        resume_start = time.perf_counter()
+        analysis = agent.analyze_resume(job_description, content)
+        per_resume.append(time.perf_counter() - resume_start)
+        input_tokens += analysis["token_usage"]["input_tokens"]
+        output_tokens += analysis["token_usage"]["output_tokens"]
+        cost += analysis["token_usage"].get("cost", 0.0)
+        scores[name] = analysis["total_score"]
+    wall_time = time.perf_counter() - start
+
+    return {
+        "wall_time": wall_time,
+        "mean_resume_time": sum(per_resume) / len(per_resume),
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cost": cost,
+        "scores": scores,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jd", required=True, help="Job description file")
+    parser.add_argument("--resumes", required=True, help="Directory of resume files")
+    parser.add_argument("--model", default=None, help="Model ID from config.yaml")
+    parser.add_argument("--modes", nargs="+", default=["fused", "parallel", "sequential"],
+                        choices=["fused", "parallel", "sequential", "bounded"])
+    parser.add_argument("--max-in-flight", type=int, default=3,
+                        help="Dimensions analyzed at once per resume in bounded mode")
+    args = parser.parse_args()
+
+    try:
+        job_description = read_file_content(args.jd)
+    except FileReadError:
+        job_description = None
+    resumes = {}
+    for file_name in sorted(os.listdir(args.resumes)):
+        try:
+            content = read_file_content(os.path.join(args.resumes, file_name))
+        except FileReadError:
+            continue
+        if content:
+            resumes[file_name] = content
+    if not job_description or not resumes:
+        parser.error("Could not read the job description or any resumes")
+
+    agents = build_agents(args.model, args.modes, args.max_in_flight)
+    results = {mode: run_mode(agent, job_description, resumes) for mode, agent in agents.items()}
+
+    print(f"Resumes analyzed: {len(resumes)}")
+    print(f"{'Mode':<12}{'Wall (s)':>10}{'Per resume (s)':>16}{'Input tok':>12}{'Output tok':>12}{'Cost ($)':>10}")
+    for mode, stats in results.items():
+        print(f"{mode:<12}{stats['wall_time']:>10.2f}{stats['mean_resume_time']:>16.2f}"
+              f"{stats['input_tokens']:>12,}{stats['output_tokens']:>12,}{stats['cost']:>10.4f}")
+
+    # Show how far fused scores drift from the multi-call baseline
+    if "fused" in results and "parallel" in results:
+        deltas = [
+            abs(results["fused"]["scores"][name] - results["parallel"]["scores"][name])
+            for name in resumes
+        ]
+        print(f"\nMean |fused - parallel| total score: {sum(deltas) / len(deltas):.2f} points")
+
+
+if __name__ == "__main__":
+    main()
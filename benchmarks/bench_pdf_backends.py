@@ -0,0 +1,133 @@
+"""Compare PDF text extraction backends on speed and fidelity.
+
+Usage:
+    python -m benchmarks.bench_pdf_backends --pdfs 200
+    python -m benchmarks.bench_pdf_backends --pdf-dir samples/
+
+By default, generates sample PDFs whose text is known and scores each
+installed backend on pages per second and fidelity: word-level F1 and
+word-order similarity against the true text. With --pdf-dir, real PDFs are
+used instead; fidelity is scored for those with a .txt file of the same
+name holding the expected text.
+"""
+import argparse
+import difflib
+import os
+import random
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.bench_lexical import synthetic_resume
+from benchmarks.documents import make_pdf, page_lines
+from pdf_backends import PDF_BACKENDS, available_pdf_backends, extract_pdf_text
+
+# Words compared for order similarity; SequenceMatcher is quadratic in the worst case
+ORDER_WORDS = 2000
+
+
+def sample_pdfs(count: int, max_pages: int, seed: int) -> List[Tuple[bytes, int, str]]:
+    """Generated (pdf bytes, pages, true text) samples"""
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(count):
+        pages = [synthetic_resume(rng) for _ in range(rng.randint(1, max_pages))]
+        truth = " ".join(" ".join(page_lines(page)) for page in pages)
+        samples.append((make_pdf(pages), len(pages), truth))
+    return samples
+
+
+def directory_pdfs(directory: str) -> List[Tuple[bytes, int, Optional[str]]]:
+    """PDFs in directory as (bytes, pages, expected text or None)"""
+    from PyPDF2 import PdfReader
+
+    samples = []
+    for name in sorted(os.listdir(directory)):
+        if not name.lower().endswith(".pdf"):
+            continue
+        path = os.path.join(directory, name)
+        with open(path, "rb") as f:
+            data = f.read()
+        truth_path = os.path.splitext(path)[0] + ".txt"
+        truth = None
+        if os.path.exists(truth_path):
+            with open(truth_path, encoding="utf-8") as f:
+                truth = f.read()
+        samples.append((data, len(PdfReader(path).pages), truth))
+    return samples
+
+
+def fidelity(extracted: str, truth: str) -> Tuple[float, float]:
+    """Word-level F1 and word-order similarity of extracted text to the truth"""
+    extracted_words, true_words = extracted.lower().split(), truth.lower().split()
+    overlap = sum((Counter(extracted_words) & Counter(true_words)).values())
+    if not overlap:
+        return 0.0, 0.0
+    precision, recall = overlap / len(extracted_words), overlap / len(true_words)
+    order = difflib.SequenceMatcher(
+        None, extracted_words[:ORDER_WORDS], true_words[:ORDER_WORDS], autojunk=False
+    ).ratio()
+    return 2 * precision * recall / (precision + recall), order
+
+
+def benchmark(backend: str, samples: List[Tuple[bytes, int, Optional[str]]]) -> Dict:
+    """Pages per second and mean fidelity for one backend"""
+    def extract(data: bytes) -> str:
+        return extract_pdf_text(data, backend)[0]
+
+    extract(samples[0][0])  # Warm up: import the library outside the timing
+
+    outputs, failures = [], 0
+    start = time.perf_counter()
+    for data, _, _ in samples:
+        try:
+            outputs.append(extract(data))
+        except Exception:
+            outputs.append(None)
+            failures += 1
+    seconds = time.perf_counter() - start
+
+    scores = [fidelity(text, truth) for text, (_, _, truth) in zip(outputs, samples)
+              if text is not None and truth is not None]
+    return {
+        "pages_per_second": sum(pages for _, pages, _ in samples) / seconds,
+        "f1": sum(f1 for f1, _ in scores) / len(scores) if scores else None,
+        "order": sum(order for _, order in scores) / len(scores) if scores else None,
+        "failures": failures
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pdfs", type=int, default=200, help="Generated sample PDFs")
+    parser.add_argument("--max-pages", type=int, default=4, help="Most pages in a generated PDF")
+    parser.add_argument("--pdf-dir", help="Benchmark the PDFs in this directory instead")
+    parser.add_argument("--backends", nargs="+", choices=sorted(PDF_BACKENDS),
+                        help="Backends to compare (default: all installed)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.pdf_dir:
+        samples = directory_pdfs(args.pdf_dir)
+    else:
+        samples = sample_pdfs(args.pdfs, args.max_pages, args.seed)
+    if not samples:
+        raise SystemExit("No PDFs to benchmark")
+
+    installed = available_pdf_backends()
+    backends = args.backends or installed
+    print(f"{len(samples)} PDFs, {sum(pages for _, pages, _ in samples)} pages")
+    print(f"Installed backends: {', '.join(installed)}\n")
+    print(f"{'Backend':<12}{'Pages/s':>10}{'Word F1':>10}{'Order':>10}{'Failed':>8}")
+    for backend in backends:
+        if backend not in installed:
+            print(f"{backend:<12}{'not installed':>38}")
+            continue
+        result = benchmark(backend, samples)
+        f1 = f"{result['f1']:.3f}" if result["f1"] is not None else "-"
+        order = f"{result['order']:.3f}" if result["order"] is not None else "-"
+        print(f"{backend:<12}{result['pages_per_second']:>10.1f}{f1:>10}{order:>10}{result['failures']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Benchmark the analysis pipeline offline against a fake chat model.
+
+Usage:
+    python -m benchmarks.bench_pipeline --sizes 1 10 100 1000 --modes parallel sequential
+
+ModelManager.initialize_model is swapped for benchmarks.fake_llm, so no
+provider is called and nothing is billed. For each mode and batch size it
+reports throughput, per-resume latency percentiles, graph overhead (batch
+time per resume with a zero-latency model) and peak traced memory.
+Provider rate limits and the adaptive concurrency window are disabled
+unless --config-limits is given, so results reflect the pipeline itself.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import tracemalloc
+from typing import Dict, List
+
+import numpy as np
+
+from benchmarks.bench_lexical import JOB_DESCRIPTION, synthetic_resume
+from benchmarks.fake_llm import LATENCY_MODELS, FakeChatModel, fixed_latency
+from model_manager import ModelManager
+
+
+def install_fake_model(model: FakeChatModel, config_limits: bool, retry_base_delay: float):
+    """Route every agent's model to the fake, optionally lifting quota-related limits"""
+    ModelManager.initialize_model = lambda self, model_id=None: model
+    if not config_limits:
+        retry_config = ModelManager.get_retry_config
+        ModelManager.get_rate_limits = lambda self, model_id: {}
+        ModelManager.get_concurrency_config = lambda self: {}
+        ModelManager.get_retry_config = lambda self: {
+            **retry_config(self), "base_delay": retry_base_delay, "max_delay": retry_base_delay * 10
+        }
+
+
+def build_agent(mode: str, max_in_flight: int):
+    """Agent for a benchmark mode; imported late so the fake model is in place first"""
+    from resume_analysis_agent import ResumeAnalysisAgent
+    if mode == "fused":
+        return ResumeAnalysisAgent(fused=True)
+    if mode == "bounded":
+        return ResumeAnalysisAgent(execution="bounded", max_in_flight=max_in_flight)
+    return ResumeAnalysisAgent(execution=mode)
+
+
+async def run_batch(agent, resumes: List[str], max_concurrency: int) -> Dict:
+    """Analyze resumes concurrently, timing each from when it starts running"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    durations = []
+    failures = 0
+
+    async def run(resume: str):
+        nonlocal failures
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await agent.analyze_resume_async(JOB_DESCRIPTION, resume)
+            except Exception:
+                failures += 1
+                return
+            durations.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(resume) for resume in resumes))
+    return {"wall_time": time.perf_counter() - start, "durations": durations, "failures": failures}
+
+
+def benchmark(agent, model: FakeChatModel, latency, error_rate: float,
+              resumes: List[str], max_concurrency: int) -> Dict:
+    """Overhead, memory and timed runs for one agent and batch"""
+    # Graph overhead: pipeline time per resume with an instant, reliable model. Wall time
+    # over the batch, since per-resume durations overlap when resumes run concurrently
+    model.latency, model.error_rate = fixed_latency(0.0), 0.0
+    overhead = asyncio.run(run_batch(agent, resumes, max_concurrency))
+
+    tracemalloc.start()
+    asyncio.run(run_batch(agent, resumes, max_concurrency))
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    model.latency, model.error_rate = latency, error_rate
+    retries_before = agent.rate_limiter.stats["retries"]
+    timed = asyncio.run(run_batch(agent, resumes, max_concurrency))
+
+    durations = np.array(timed["durations"]) if timed["durations"] else np.zeros(1)
+    return {
+        "resumes": len(resumes),
+        "throughput": len(timed["durations"]) / timed["wall_time"],
+        "p50": float(np.percentile(durations, 50)),
+        "p95": float(np.percentile(durations, 95)),
+        "p99": float(np.percentile(durations, 99)),
+        "overhead_per_resume": overhead["wall_time"] / len(resumes),
+        "peak_memory_mb": peak_memory / 2 ** 20,
+        "failures": timed["failures"],
+        "retries": agent.rate_limiter.stats["retries"] - retries_before,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--modes", nargs="+", default=["parallel", "sequential"],
+                        choices=["parallel", "sequential", "bounded", "fused"])
+    parser.add_argument("--max-in-flight", type=int, default=3, help="Per-resume limit for bounded mode")
+    parser.add_argument("--max-concurrency", type=int, default=10, help="Resumes analyzed at once")
+    parser.add_argument("--latency", choices=sorted(LATENCY_MODELS), default="lognormal")
+    parser.add_argument("--latency-median", type=float, default=0.05, help="Seconds per fake LLM call")
+    parser.add_argument("--latency-spread", type=float, default=0.5,
+                        help="Lognormal sigma, or relative half-width for uniform")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of calls failing with a 429")
+    parser.add_argument("--retry-base-delay", type=float, default=0.01,
+                        help="Backoff base in seconds when config limits are off")
+    parser.add_argument("--config-limits", action="store_true",
+                        help="Keep config.yaml rate limits and adaptive concurrency")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Also write results as JSON, e.g. to track regressions")
+    args = parser.parse_args()
+
+    model = FakeChatModel(seed=args.seed)
+    install_fake_model(model, args.config_limits, args.retry_base_delay)
+    latency = LATENCY_MODELS[args.latency](args.latency_median, args.latency_spread)
+
+    rng = random.Random(args.seed)
+    corpus = [synthetic_resume(rng) for _ in range(max(args.sizes))]
+
+    results = []
+    print(f"{'Mode':<11}{'Resumes':>8}{'Res/s':>9}{'p50 (s)':>9}{'p95 (s)':>9}{'p99 (s)':>9}"
+          f"{'Overhead (ms)':>15}{'Peak MB':>9}{'Failed':>8}{'Retries':>9}")
+    for mode in args.modes:
+        agent = build_agent(mode, args.max_in_flight)
+        for size in args.sizes:
+            result = {"mode": mode, **benchmark(
+                agent, model, latency, args.error_rate, corpus[:size], args.max_concurrency
+            )}
+            results.append(result)
+            print(f"{mode:<11}{size:>8}{result['throughput']:>9.1f}{result['p50']:>9.3f}"
+                  f"{result['p95']:>9.3f}{result['p99']:>9.3f}{result['overhead_per_resume'] * 1000:>15.1f}"
+                  f"{result['peak_memory_mb']:>9.1f}{result['failures']:>8}{result['retries']:>9}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Generate PDF, DOCX and TXT resume files for extraction benchmarks.
+
+The writers are deliberately minimal (one font, plain paragraphs) so the
+benchmarks need no document-authoring dependency; every parser the app
+supports reads them.
+"""
+import io
+import os
+import random
+import textwrap
+import zipfile
+from typing import Dict, List
+
+from benchmarks.bench_lexical import synthetic_resume
+
+LINES_PER_PAGE = 50
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def page_lines(text: str) -> List[str]:
+    """The lines make_pdf writes for a page of text; longer text is cut at the page bottom"""
+    return textwrap.wrap(text, 95)[:LINES_PER_PAGE] or [""]
+
+
+def make_pdf(pages: List[str]) -> bytes:
+    """A PDF with one Helvetica text page per entry in pages"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for text in pages:
+        lines = page_lines(text)
+        stream = "BT /F1 10 Tf 50 780 Td 14 TL " + " ".join(f"({_pdf_escape(line)}) Tj T*" for line in lines) + " ET"
+        stream = stream.encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (len(objects))
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = output.tell()
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        output.write(b"%010d 00000 n \n" % offset)
+    output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return output.getvalue()
+
+
+def make_docx(paragraphs: List[str]) -> bytes:
+    """A DOCX holding paragraphs as plain runs"""
+    body = "".join(
+        f"<w:p><w:r><w:t>{paragraph.replace('&', '&amp;').replace('<', '&lt;')}</w:t></w:r></w:p>"
+        for paragraph in paragraphs
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '</Types>'
+    )
+    relationships = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="word/document.xml"/></Relationships>'
+    )
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", content_types)
+        archive.writestr("_rels/.rels", relationships)
+        archive.writestr("word/document.xml", document)
+    return output.getvalue()
+
+
+def write_corpus(directory: str, count: int, seed: int = 0, max_pages: int = 4,
+                 mix: Dict[str, float] = None) -> List[str]:
+    """Write count synthetic resumes to directory, returning their paths
+
+    mix gives the share of each extension (default 60% PDF, 30% DOCX,
+    10% TXT); PDFs have one to max_pages pages.
+    """
+    mix = mix or {".pdf": 0.6, ".docx": 0.3, ".txt": 0.1}
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i in range(count):
+        extension = rng.choices(list(mix), weights=list(mix.values()))[0]
+        pages = [synthetic_resume(rng) for _ in range(rng.randint(1, max_pages))]
+        if extension == ".pdf":
+            data = make_pdf(pages)
+        elif extension == ".docx":
+            data = make_docx(pages)
+        else:
+            data = "\n\n".join(pages).encode("utf-8")
+        path = os.path.join(directory, f"resume_{i:05d}{extension}")
+        with open(path, "wb") as f:
+            f.write(data)
+        paths.append(path)
+    return paths
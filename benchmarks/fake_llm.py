@@ -0,0 +1,118 @@
+"""Offline stand-in for the provider chat models, for benchmarks.
+
+FakeChatModel implements the one method the agent uses,
+with_structured_output(schema, include_raw=True), and returns valid
+instances of any of the agent's output schemas. Outputs are a pure function
+of the schema and prompt, so repeated runs score identically; latency and
+failures are drawn from a seeded generator.
+"""
+import asyncio
+import hashlib
+import random
+import threading
+import time
+import typing
+from typing import Callable, Optional
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel
+
+from token_accounting import count_tokens
+
+LatencyModel = Callable[[random.Random], float]
+
+
+def fixed_latency(seconds: float) -> LatencyModel:
+    """Every call takes the same time"""
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyModel:
+    """Latency spread evenly between low and high seconds"""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float) -> LatencyModel:
+    """Right-skewed latency, as providers show: most calls near median, a long slow tail"""
+    return lambda rng: median * rng.lognormvariate(0.0, sigma)
+
+
+LATENCY_MODELS = {
+    "fixed": lambda median, spread: fixed_latency(median),
+    "uniform": lambda median, spread: uniform_latency(median * (1 - spread), median * (1 + spread)),
+    "lognormal": lambda median, spread: lognormal_latency(median, spread),
+}
+
+
+class FakeRateLimitError(Exception):
+    """Injected failure that the rate limiter treats as a retryable 429"""
+    status_code = 429
+
+
+def build_output(schema, seed: str) -> BaseModel:
+    """A valid schema instance whose values are derived from seed"""
+    rng = random.Random(hashlib.sha256(f"{schema.__name__}:{seed}".encode()).digest())
+    values = {}
+    for name, field in schema.model_fields.items():
+        annotation = field.annotation
+        if typing.get_origin(annotation) is typing.Union:
+            annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            values[name] = build_output(annotation, seed)
+        elif annotation is float:
+            values[name] = float(rng.randint(0, 100))
+        elif typing.get_origin(annotation) is list:
+            values[name] = [f"{name} item {i}" for i in range(rng.randint(1, 5))]
+        else:
+            values[name] = f"Simulated {name.replace('_', ' ')} for this candidate."
+    return schema(**values)
+
+
+class FakeChatModel:
+    """Chat model double with configurable latency and error rate"""
+
+    def __init__(self, latency: Optional[LatencyModel] = None, error_rate: float = 0.0, seed: int = 0):
+        self.latency = latency or fixed_latency(0.0)
+        self.error_rate = error_rate
+        self.calls = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _draw(self):
+        """Latency for the next call and whether it fails"""
+        with self._lock:
+            self.calls += 1
+            fails = self._rng.random() < self.error_rate
+            self.errors += fails
+            return max(0.0, self.latency(self._rng)), fails
+
+    def _respond(self, schema, prompt, include_raw: bool, fails: bool):
+        if fails:
+            raise FakeRateLimitError("Simulated rate limit")
+        text = prompt.to_string() if hasattr(prompt, "to_string") else str(prompt)
+        parsed = build_output(schema, text)
+        if not include_raw:
+            return parsed
+        output_tokens = count_tokens(parsed.model_dump_json())
+        input_tokens = count_tokens(text)
+        raw = AIMessage(content="", usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens
+        })
+        return {"raw": raw, "parsed": parsed, "parsing_error": None}
+
+    def with_structured_output(self, schema, include_raw: bool = False, **kwargs):
+        def invoke(prompt):
+            delay, fails = self._draw()
+            time.sleep(delay)
+            return self._respond(schema, prompt, include_raw, fails)
+
+        async def ainvoke(prompt):
+            delay, fails = self._draw()
+            await asyncio.sleep(delay)
+            return self._respond(schema, prompt, include_raw, fails)
+
+        return RunnableLambda(invoke, afunc=ainvoke)
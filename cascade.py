@@ -0,0 +1,128 @@
+import math
+from typing import AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from llm_cache import LLMResultCache
+from model_manager import ModelManager
+from resume_analysis_agent import ResumeAnalysisAgent
+
+
+class CascadeAnalyzer:
+    """Screen every resume with a cheap model, then re-analyze contenders with a premium model
+
+    Contenders are the top_fraction of screened resumes plus any whose screen
+    score falls inside borderline_band. Exposes the same analyze_batch
+    interface as ResumeAnalysisAgent.
+    """
+
+    def __init__(self, screen_agent: ResumeAnalysisAgent, premium_agent: ResumeAnalysisAgent,
+                 top_fraction: float = 0.2, borderline_band: Optional[Sequence[float]] = None):
+        if not 0 <= top_fraction <= 1:
+            raise ValueError("top_fraction must be between 0 and 1")
+        self.screen_agent = screen_agent
+        self.premium_agent = premium_agent
+        self.top_fraction = top_fraction
+        self.borderline_band = tuple(borderline_band) if borderline_band else None
+
+    @classmethod
+    def from_config(cls, model_manager: Optional[ModelManager] = None,
+                    cache: Optional[LLMResultCache] = None, **agent_kwargs) -> "CascadeAnalyzer":
+        """Build a cascade from the cascade section of config.yaml
+
+        agent_kwargs (e.g. section_routing, job_digest) are passed to the
+        premium agent.
+        """
+        model_manager = model_manager or ModelManager()
+        config = model_manager.get_cascade_config()
+        screen_model = config.get('screen_model') or model_manager.get_cheapest_model_id()
+
+        screen_agent = ResumeAnalysisAgent(
+            screen_model,
+            fused=config.get('screen_fused', True),
+            cache=cache,
+            job_digest=agent_kwargs.get('job_digest', False)
+        )
+        premium_agent = ResumeAnalysisAgent(config.get('premium_model'), cache=cache, **agent_kwargs)
+        return cls(
+            screen_agent,
+            premium_agent,
+            top_fraction=config.get('top_fraction', 0.2),
+            borderline_band=config.get('borderline_band')
+        )
+
+    def select_contenders(self, screened: Dict[str, dict]) -> List[str]:
+        """IDs of screened resumes that deserve a premium re-analysis"""
+        ranked = sorted(screened, key=lambda resume_id: screened[resume_id]['total_score'], reverse=True)
+        contenders = set(ranked[:math.ceil(len(ranked) * self.top_fraction)])
+
+        if self.borderline_band is not None:
+            low, high = self.borderline_band
+            contenders.update(
+                resume_id for resume_id, analysis in screened.items()
+                if low <= analysis['total_score'] <= high
+            )
+        return [resume_id for resume_id in ranked if resume_id in contenders]
+
+    async def analyze_batch(self, job_description: str, resumes: Dict[str, str],
+                            weights: Optional[Dict[str, float]] = None,
+                            max_concurrency: int = 10,
+                            on_error: Optional[Callable[[str, Exception], None]] = None
+                            ) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        Screen all resumes, yield those that are not contenders, then yield
+        premium analyses of the contenders as each completes. on_error is
+        passed to both passes; a contender whose premium analysis fails falls
+        back to its screening result.
+        """
+        screened = {}
+        async for resume_id, analysis in self.screen_agent.analyze_batch(
+            job_description, resumes, weights, max_concurrency=max_concurrency, on_error=on_error
+        ):
+            analysis['cascade_tier'] = "screen"
+            analysis['model_id'] = self.screen_agent.model_id
+            screened[resume_id] = analysis
+
+        contenders = self.select_contenders(screened)
+        for resume_id, analysis in screened.items():
+            if resume_id not in contenders:
+                yield resume_id, analysis
+
+        premium_errors = {}
+
+        def on_premium_error(resume_id: str, error: Exception):
+            premium_errors[resume_id] = str(error)
+
+        async for resume_id, analysis in self.premium_agent.analyze_batch(
+            job_description,
+            {resume_id: resumes[resume_id] for resume_id in contenders},
+            weights,
+            max_concurrency=max_concurrency,
+            on_error=on_premium_error if on_error is not None else None
+        ):
+            screen_analysis = screened[resume_id]
+            analysis['cascade_tier'] = "premium"
+            analysis['model_id'] = self.premium_agent.model_id
+            analysis['screen_score'] = screen_analysis['total_score']
+            self._add_screen_usage(analysis, screen_analysis)
+            yield resume_id, analysis
+
+        for resume_id, error in premium_errors.items():
+            screened[resume_id]['premium_error'] = error
+            yield resume_id, screened[resume_id]
+
+    @staticmethod
+    def _add_screen_usage(analysis: dict, screen_analysis: dict):
+        """Fold the screening pass's tokens and cost into the premium result"""
+        usage = analysis['token_usage']
+        screen_usage = screen_analysis['token_usage']
+        usage['input_tokens'] += screen_usage['input_tokens']
+        usage['output_tokens'] += screen_usage['output_tokens']
+        usage['cost'] += screen_usage['cost']
+        usage['by_node'] = {
+            **usage['by_node'],
+            "screen": {
+                "input_tokens": screen_usage['input_tokens'],
+                "output_tokens": screen_usage['output_tokens'],
+                "cost": screen_usage['cost'],
+                "source": "cascade"
+            }
+        }
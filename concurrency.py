@@ -0,0 +1,184 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from rate_limiter import is_retryable
+
+
+def _grant(future: asyncio.Future):
+    """Wake an async waiter that has been handed a slot (runs on the waiter's loop)"""
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on in-flight LLM calls, shared across threads and event loops
+
+    Each healthy call (latency within latency_tolerance times the long-run
+    average) grows the window by increase / window, i.e. about `increase`
+    per window's worth of calls. A 429 or timeout multiplies it by
+    decrease_factor, at most once per typical call latency so one burst of
+    failures counts as a single congestion event.
+    """
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 32,
+                 increase: float = 1.0, decrease_factor: float = 0.5,
+                 latency_tolerance: float = 2.0):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Concurrency limits must satisfy 1 <= min <= initial <= max")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.window = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters = deque()
+        self._last_decrease = 0.0
+        self._latency_recent = None
+        self._latency_baseline = None
+        self._stats = {"calls": 0, "errors": 0, "congestion_events": 0, "slow_calls": 0, "peak_in_flight": 0}
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight"""
+        return int(self.window)
+
+    def _take_slot(self):
+        self.in_flight += 1
+        self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], self.in_flight)
+
+    def _wake_waiters(self):
+        """Hand free slots to queued async waiters, then let blocked threads re-check"""
+        while self._async_waiters and self.in_flight < self.limit:
+            loop, future = self._async_waiters.popleft()
+            self._take_slot()
+            loop.call_soon_threadsafe(_grant, future)
+        self._condition.notify_all()
+
+    def acquire(self):
+        """Block the calling thread until a slot is free"""
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self._take_slot()
+
+    async def aacquire(self):
+        """Wait for a free slot without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._async_waiters and self.in_flight < self.limit:
+                self._take_slot()
+                return
+            future = loop.create_future()
+            self._async_waiters.append((loop, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._async_waiters.remove((loop, future))
+                except ValueError:
+                    # The slot was granted before the cancellation landed; give it back
+                    self.in_flight -= 1
+                    self._wake_waiters()
+            raise
+
+    def release(self, latency: float, error: Optional[Exception] = None, cancelled: bool = False):
+        """Free a slot and adapt the window to the call's outcome
+
+        Cancelled calls free their slot without affecting the window.
+        """
+        with self._lock:
+            self.in_flight -= 1
+            now = time.monotonic()
+
+            if error is not None:
+                self._stats["calls"] += 1
+                self._stats["errors"] += 1
+                cooldown = self._latency_recent or 0.0
+                if is_retryable(error) and now - self._last_decrease >= cooldown:
+                    self.window = max(self.min_limit, self.window * self.decrease_factor)
+                    self._last_decrease = now
+                    self._stats["congestion_events"] += 1
+            elif not cancelled:
+                self._stats["calls"] += 1
+                if self._latency_baseline is None:
+                    self._latency_recent = self._latency_baseline = latency
+                self._latency_recent += 0.3 * (latency - self._latency_recent)
+                self._latency_baseline += 0.02 * (latency - self._latency_baseline)
+                if self._latency_recent <= self.latency_tolerance * self._latency_baseline:
+                    self.window = min(self.max_limit, self.window + self.increase / self.window)
+                else:
+                    self._stats["slow_calls"] += 1
+
+            self._wake_waiters()
+
+    def run(self, func: Callable, *args, **kwargs):
+        """Call func while holding a slot"""
+        self.acquire()
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.release(time.perf_counter() - start, e)
+            raise
+        self.release(time.perf_counter() - start)
+        return result
+
+    async def arun(self, func: Callable[..., Awaitable], *args, **kwargs):
+        """Async variant of run; func must return an awaitable"""
+        await self.aacquire()
+        start = time.perf_counter()
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            self.release(time.perf_counter() - start, cancelled=True)
+            raise
+        except Exception as e:
+            self.release(time.perf_counter() - start, e)
+            raise
+        self.release(time.perf_counter() - start)
+        return result
+
+    def stats(self) -> Dict:
+        """Current window and counters"""
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "window": round(self.window, 2),
+                "in_flight": self.in_flight,
+                "waiting": len(self._async_waiters),
+                "latency_recent": self._latency_recent,
+                "latency_baseline": self._latency_baseline,
+                **self._stats
+            }
+
+
+_controllers: Dict[Tuple[str, str], AdaptiveConcurrencyLimiter] = {}
+_controllers_lock = threading.Lock()
+
+
+def get_concurrency_limiter(provider: str, model_id: str,
+                            config: Optional[Dict] = None) -> AdaptiveConcurrencyLimiter:
+    """Process-wide concurrency controller for a provider/model, created on first use"""
+    key = (provider, model_id)
+    with _controllers_lock:
+        if key not in _controllers:
+            config = config or {}
+            _controllers[key] = AdaptiveConcurrencyLimiter(
+                initial=config.get('initial', 4),
+                min_limit=config.get('min', 1),
+                max_limit=config.get('max', 32),
+                increase=config.get('increase', 1.0),
+                decrease_factor=config.get('decrease_factor', 0.5),
+                latency_tolerance=config.get('latency_tolerance', 2.0)
+            )
+        return _controllers[key]
@@ -1,6 +1,11 @@
 import streamlit as st
 import pandas as pd
-import os
+
+def format_component_score(score_data):
+    """Format a component score, marking components that were not evaluated"""
+    if score_data.get('status', 'completed') != 'completed':
+        return score_data['status'].replace('_', ' ').title()
+    return f"{score_data['score']:.1f}%"
 
 def create_summary_table(analyzed_results):
     """Create summary DataFrame for displaying results"""
@@ -9,14 +14,22 @@ def create_summary_table(analyzed_results):
         summary_data.append({
             'Resume': result['file_name'],
             'Total Score': f"{result['total_score']:.1f}%",
-            'Education': f"{result['component_scores']['education']['score']:.1f}%",
-            'Skills': f"{result['component_scores']['skills']['score']:.1f}%",
-            'Experience': f"{result['component_scores']['experience']['score']:.1f}%",
-            'Tools': f"{result['component_scores']['tools']['score']:.1f}%",
-            'Industry': f"{result['component_scores']['industry']['score']:.1f}%",
-            'Role': f"{result['component_scores']['role']['score']:.1f}%",
-            'Preferences': f"{result['component_scores']['preferences']['score']:.1f}%"
+            'Education': format_component_score(result['component_scores']['education']),
+            'Skills': format_component_score(result['component_scores']['skills']),
+            'Experience': format_component_score(result['component_scores']['experience']),
+            'Tools': format_component_score(result['component_scores']['tools']),
+            'Industry': format_component_score(result['component_scores']['industry']),
+            'Role': format_component_score(result['component_scores']['role']),
+            'Preferences': format_component_score(result['component_scores']['preferences'])
         })
+        if result.get('screened_out'):
+            summary_data[-1]['Status'] = "Screened out"
+        elif not result.get('complete', True):
+            summary_data[-1]['Status'] = "Partial (timed out)"
+        elif result.get('truncated'):
+            summary_data[-1]['Status'] = "Truncated"
+        if 'lexical_score' in result:
+            summary_data[-1]['Lexical Score'] = f"{result['lexical_score']:.1f}"
     return pd.DataFrame(summary_data)
 
 def display_file_tree():
@@ -45,49 +58,44 @@ def display_file_tree():
     # Display Job Posting section
     st.markdown('<div class="file-tree">', unsafe_allow_html=True)
     st.markdown('<div class="folder-name">📁 job_posting</div>', unsafe_allow_html=True)
-    job_posting_path = os.path.join(st.session_state.temp_dir, 'job_posting')
-    if os.path.exists(job_posting_path):
-        for file in os.listdir(job_posting_path):
-            with st.container():
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.markdown(f'<div class="file-item">📄 {file}</div>', unsafe_allow_html=True)
-                with col2:
-                    with open(os.path.join(job_posting_path, file), 'rb') as f:
-                        st.download_button(
-                            label="📥",
-                            data=f,
-                            file_name=file,
-                            mime="application/octet-stream",
-                            key=f"dl_jd_{file}"
-                        )
+    for file, data in st.session_state.uploads['job_posting'].items():
+        with st.container():
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.markdown(f'<div class="file-item">📄 {file}</div>', unsafe_allow_html=True)
+            with col2:
+                st.download_button(
+                    label="📥",
+                    data=data,
+                    file_name=file,
+                    mime="application/octet-stream",
+                    key=f"dl_jd_{file}"
+                )
 
     # Display Resumes section
     st.markdown('<div class="folder-name">📁 resumes</div>', unsafe_allow_html=True)
-    resumes_path = os.path.join(st.session_state.temp_dir, 'resumes')
-    if os.path.exists(resumes_path):
-        for file in os.listdir(resumes_path):
-            with st.container():
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.markdown(f'<div class="file-item">📄 {file}</div>', unsafe_allow_html=True)
-                with col2:
-                    with open(os.path.join(resumes_path, file), 'rb') as f:
-                        st.download_button(
-                            label="📥",
-                            data=f,
-                            file_name=file,
-                            mime="application/octet-stream",
-                            key=f"dl_resume_{file}"
-                        )
+    for file, data in st.session_state.uploads['resumes'].items():
+        with st.container():
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.markdown(f'<div class="file-item">📄 {file}</div>', unsafe_allow_html=True)
+            with col2:
+                st.download_button(
+                    label="📥",
+                    data=data,
+                    file_name=file,
+                    mime="application/octet-stream",
+                    key=f"dl_resume_{file}"
+                )
     st.markdown('</div>', unsafe_allow_html=True)
 
 def display_detailed_results(analyzed_results):
     """Display detailed analysis for each resume with download option"""
     for idx, result in enumerate(analyzed_results, 1):
         with st.expander(f"📄 Resume #{idx}: {result['file_name']}", expanded=idx==1):
-            # Add download button at the top
-            if os.path.exists(result['file_path']):
+            # Add download button at the top, served from the uploaded bytes
+            resume_data = st.session_state.uploads['resumes'].get(result['file_name'])
+            if resume_data is not None:
                 col1, col2 = st.columns([3, 1])
                 with col1:
                     st.markdown(f"""
@@ -96,14 +104,13 @@ def display_detailed_results(analyzed_results):
                         </div>
                     """, unsafe_allow_html=True)
                 with col2:
-                    with open(result['file_path'], 'rb') as file:
-                        st.download_button(
-                            label="📥 Download Resume",
-                            data=file,
-                            file_name=result['file_name'],
-                            mime="application/octet-stream",
-                            key=f"download_resume_{idx}"
-                        )
+                    st.download_button(
+                        label="📥 Download Resume",
+                        data=resume_data,
+                        file_name=result['file_name'],
+                        mime="application/octet-stream",
+                        key=f"download_resume_{idx}"
+                    )
             
             # Display total score
             st.markdown(f"""
@@ -112,6 +119,21 @@ def display_detailed_results(analyzed_results):
                     <div class="total-score">{result['total_score']:.1f}%</div>
                 </div>
             """, unsafe_allow_html=True)
+            if result.get('screened_out'):
+                st.warning(
+                    "Screened out: first-tier score below the gating threshold, "
+                    "remaining components were not analyzed."
+                )
+            if not result.get('complete', True):
+                st.warning(
+                    "Partial result: some components timed out and the total score "
+                    "covers only the completed ones."
+                )
+            if result.get('truncated'):
+                st.warning(
+                    f"Long resume: text was cut at the {result['truncated']} limit, "
+                    "so later sections were not analyzed."
+                )
             
             # Display all component scores in two rows
             row1_cols = st.columns(4)
@@ -129,13 +151,13 @@ def display_detailed_results(analyzed_results):
                     st.markdown(f"""
                         <div class="score-card">
                             <div class="score-label">{component.title()} Score</div>
-                            <div class="score-value">{score_data['score']:.1f}%</div>
+                            <div class="score-value">{format_component_score(score_data)}</div>
                         </div>
                     """, unsafe_allow_html=True)
                     st.markdown("#### Analysis")
                     st.markdown(f"""
                         <div class="explanation">
-                            {score_data['details']['explanation']}
+                            {score_data['details'].get('explanation', 'Not evaluated.')}
                         </div>
                     """, unsafe_allow_html=True)
             
@@ -146,13 +168,13 @@ def display_detailed_results(analyzed_results):
                     st.markdown(f"""
                         <div class="score-card">
                             <div class="score-label">{component.title()} Score</div>
-                            <div class="score-value">{score_data['score']:.1f}%</div>
+                            <div class="score-value">{format_component_score(score_data)}</div>
                         </div>
                     """, unsafe_allow_html=True)
                     st.markdown("#### Analysis")
                     st.markdown(f"""
                         <div class="explanation">
-                            {score_data['details']['explanation']}
+                            {score_data['details'].get('explanation', 'Not evaluated.')}
                         </div>
                     """, unsafe_allow_html=True)
 
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# Bump when extraction output changes, so text cached by older code is not reused
+EXTRACTOR_VERSION = "1"
+
+
+class ExtractionCache:
+    """Persistent SQLite cache of text extracted from resume and job files
+
+    Entries are keyed by a hash of the file's bytes, extension and extractor,
+    so a file is parsed once no matter how often it is uploaded, renamed or
+    re-analyzed.
+    """
+
+    def __init__(self, path: str = ".cache/extracted_text.sqlite", max_entries: Optional[int] = 100000):
+        """Open (or create) the cache database at path"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS extractions (
+                key TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                last_access REAL NOT NULL,
+                truncated TEXT
+            )
+        """)
+        # Databases created before truncation was recorded lack the column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(extractions)")}
+        if "truncated" not in columns:
+            self._conn.execute("ALTER TABLE extractions ADD COLUMN truncated TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_extraction_access ON extractions (last_access)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(data: bytes, extension: str, extractor: str = "") -> str:
+        """Build a content-addressed key for a file's bytes and the extractor that reads them"""
+        digest = hashlib.sha256(data)
+        digest.update(f"\0{extension}\0{extractor}\0{EXTRACTOR_VERSION}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Return the cached (text, truncating limit) for key, or None on a miss"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, truncated FROM extractions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE extractions SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0], row[1]
+
+    def put_many(self, entries: Dict[str, Tuple[str, Optional[str]]]):
+        """Store (text, truncating limit) pairs by key in one transaction, evicting the least recently used"""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO extractions (key, content, last_access, truncated) VALUES (?, ?, ?, ?)",
+                [(key, content, now, truncated) for key, (content, truncated) in entries.items()]
+            )
+            self._evict()
+            self._conn.commit()
+
+    def put(self, key: str, content: str, truncated: Optional[str] = None):
+        """Store the text extracted for key and the limit that truncated it, if any"""
+        self.put_many({key: (content, truncated)})
+
+    def clear(self) -> int:
+        """Delete every entry; returns rows removed"""
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM extractions").rowcount
+            self._conn.commit()
+        return removed
+
+    def stats(self) -> Dict:
+        """Get hit/miss counters and current size"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries
+        }
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self):
+        """Drop the least recently used entries above max_entries"""
+        if self.max_entries is None:
+            return
+        entries = self._conn.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+        overflow = entries - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM extractions WHERE key IN "
+                "(SELECT key FROM extractions ORDER BY last_access ASC LIMIT ?)",
+                (overflow,)
+            )
+
+
+def open_extraction_cache(config: Optional[Dict] = None) -> Optional[ExtractionCache]:
+    """Open the extraction cache described by an extraction config section, or None if disabled"""
+    cache_config = (config or {}).get('cache', {})
+    if not cache_config.get('enabled', False):
+        return None
+    return ExtractionCache(
+        path=cache_config.get('path', '.cache/extracted_text.sqlite'),
+        max_entries=cache_config.get('max_entries', 100000)
+    )
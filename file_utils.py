@@ -1,50 +1,287 @@
+import io
+import multiprocessing
 import os
-import PyPDF2
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
 import docx2txt
-import streamlit as st
 
-def read_file_content(file_path):
-    """Read content from PDF or DOCX files"""
+from extraction_cache import ExtractionCache
+from pdf_backends import extract_pdf_text, resolve_pdf_backend
+from tracing import tracer
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.txt')
+
+# An uploaded file's contents, and a file given either by path or by its bytes
+Upload = Union[bytes, bytearray, memoryview, BinaryIO]
+Source = Union[str, bytes]
+
+
+class FileReadError(Exception):
+    """Raised when a resume or job description file cannot be read"""
+
+
+def read_file_content(file_path, cache: Optional[ExtractionCache] = None, pdf_backend: str = "auto",
+                      limits: Optional[Dict] = None,
+                      on_truncated: Optional[Callable[[str, str], None]] = None):
+    """Read content from PDF, DOCX or TXT files
+
+    With a cache, text already extracted from identical bytes is reused.
+    pdf_backend names a backend from pdf_backends, or "auto". limits caps
+    max_bytes read, max_pages parsed and max_chars returned; text cut short
+    is reported to on_truncated with the limit that was hit.
+    Raises FileReadError for unreadable, oversized or unsupported files,
+    leaving it to the caller (UI or batch runner) to report.
+    """
+    return _read_one(file_path, file_path, "read_file_content", cache, pdf_backend, limits, on_truncated)
+
+
+def read_upload(file_name: str, data: Upload, cache: Optional[ExtractionCache] = None,
+                pdf_backend: str = "auto", limits: Optional[Dict] = None,
+                on_truncated: Optional[Callable[[str, str], None]] = None) -> str:
+    """Read content from an uploaded file's bytes, without writing it to disk
+
+    data may be bytes, a memoryview or a binary stream such as Streamlit's
+    UploadedFile; file_name gives the format. Otherwise as read_file_content.
+    """
+    return _read_one(file_name, _upload_bytes(data), "read_upload", cache, pdf_backend, limits, on_truncated)
+
+
+def read_files(file_paths: List[str], cache: Optional[ExtractionCache] = None,
+               max_workers: Optional[int] = None,
+               on_error: Optional[Callable[[str, FileReadError], None]] = None,
+               pdf_backend: str = "auto", limits: Optional[Dict] = None,
+               on_truncated: Optional[Callable[[str, str], None]] = None) -> Dict[str, str]:
+    """Read many files, parsing cache misses in parallel worker processes
+
+    Returns contents by path, in input order. A file that cannot be read is
+    passed to on_error and left out; without on_error its FileReadError is
+    raised. max_workers defaults to the CPU count. limits and on_truncated
+    are as for read_file_content.
+    """
+    return _read_batch(
+        {path: path for path in file_paths}, "read_files",
+        cache, max_workers, on_error, pdf_backend, limits, on_truncated
+    )
+
+
+def read_uploads(uploads: Dict[str, Upload], cache: Optional[ExtractionCache] = None,
+                 max_workers: Optional[int] = None,
+                 on_error: Optional[Callable[[str, FileReadError], None]] = None,
+                 pdf_backend: str = "auto", limits: Optional[Dict] = None,
+                 on_truncated: Optional[Callable[[str, str], None]] = None) -> Dict[str, str]:
+    """Read many uploaded files from memory, keyed by file name
+
+    As read_files, except that worker processes are sent each file's bytes;
+    with max_workers=1, files are parsed in place without copies.
+    """
+    return _read_batch(
+        {name: _upload_bytes(data) for name, data in uploads.items()}, "read_uploads",
+        cache, max_workers, on_error, pdf_backend, limits, on_truncated
+    )
+
+
+def _upload_bytes(data: Upload) -> bytes:
+    """The bytes of an upload, copying only when they are not already held as bytes"""
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, io.BytesIO):
+        # getvalue() shares an unmodified BytesIO's initial bytes; getbuffer() would copy them
+        return data.getvalue()
+    if isinstance(data, memoryview):
+        if isinstance(data.obj, bytes) and data.contiguous and data.nbytes == len(data.obj):
+            return data.obj
+        return data.tobytes()
+    if isinstance(data, bytearray):
+        return bytes(data)
+    data.seek(0)
+    return data.read()
+
+
+def _read_one(name: str, source: Source, span: str, cache: Optional[ExtractionCache], pdf_backend: str,
+              limits: Optional[Dict], on_truncated: Optional[Callable[[str, str], None]]) -> str:
+    """Extract one file given as a path or bytes, through the cache if there is one"""
+    file_extension = _checked_extension(name)
+    pdf_backend = resolve_pdf_backend(pdf_backend)
+    limits = limits or {}
+    with tracer.span(span, path=name, extension=file_extension, pdf_backend=pdf_backend) as attributes:
+        data = _source_bytes(source, limits.get('max_bytes'))
+        if cache is None:
+            content, truncated = _extract_text(data, file_extension, pdf_backend, limits)
+        else:
+            key = cache.make_key(data, file_extension, _extractor(file_extension, pdf_backend, limits))
+            cached = cache.get(key)
+            attributes["cached"] = cached is not None
+            if cached is None:
+                content, truncated = _extract_text(data, file_extension, pdf_backend, limits)
+                cache.put(key, content, truncated)
+            else:
+                content, truncated = cached
+        attributes.update(characters=len(content), truncated=truncated)
+
+    if truncated is not None and on_truncated is not None:
+        on_truncated(name, truncated)
+    return content
+
+
+def _read_batch(sources: Dict[str, Source], span: str, cache: Optional[ExtractionCache],
+                max_workers: Optional[int], on_error: Optional[Callable[[str, FileReadError], None]],
+                pdf_backend: str, limits: Optional[Dict],
+                on_truncated: Optional[Callable[[str, str], None]]) -> Dict[str, str]:
+    """Extract files given by name as paths or bytes, consulting the cache before parsing"""
+    def fail(name, error):
+        if on_error is None:
+            raise error
+        on_error(name, error)
+
+    pdf_backend = resolve_pdf_backend(pdf_backend)
+    limits = limits or {}
+    extractions, keys, misses = {}, {}, []
+    with tracer.span(span, files=len(sources), pdf_backend=pdf_backend) as attributes:
+        for name, source in sources.items():
+            try:
+                extension = _checked_extension(name)
+                if cache is not None:
+                    keys[name] = cache.make_key(
+                        _source_bytes(source, limits.get('max_bytes')), extension,
+                        _extractor(extension, pdf_backend, limits)
+                    )
+                    cached = cache.get(keys[name])
+                    if cached is not None:
+                        extractions[name] = cached
+                        continue
+            except FileReadError as e:
+                fail(name, e)
+                continue
+            misses.append(name)
+
+        extracted = {}
+        results = _extract_sources(
+            [sources[name] for name in misses], [_checked_extension(name) for name in misses],
+            max_workers, pdf_backend, limits
+        )
+        for name, result in zip(misses, results):
+            if isinstance(result, FileReadError):
+                fail(name, result)
+            else:
+                extractions[name] = extracted[name] = result
+        if cache is not None and extracted:
+            cache.put_many({keys[name]: extraction for name, extraction in extracted.items()})
+        truncated = {name: extractions[name][1] for name in extractions if extractions[name][1] is not None}
+        attributes.update(cached=len(sources) - len(misses), extracted=len(extracted), truncated=len(truncated))
+
+    if on_truncated is not None:
+        for name in sources:
+            if name in truncated:
+                on_truncated(name, truncated[name])
+    return {name: extractions[name][0] for name in sources if name in extractions}
+
+
+def _extract_sources(sources: List[Source], extensions: List[str], max_workers: Optional[int],
+                     pdf_backend: str, limits: Dict) -> List[Union[Tuple[str, Optional[str]], FileReadError]]:
+    """Extract files in a process pool, returning (text, truncated) or an error for each"""
+    extract = partial(_extract_source_or_error, pdf_backend=pdf_backend, limits=limits)
+    workers = min(max_workers or os.cpu_count() or 1, len(sources))
+    if workers <= 1:
+        return [extract(source, extension) for source, extension in zip(sources, extensions)]
+
+    # Spawn rather than fork: the app and agent run threads, whose locks a forked child would inherit
+    context = multiprocessing.get_context("spawn")
+    chunksize = max(1, len(sources) // (workers * 4))
+    try:
+        with ProcessPoolExecutor(workers, mp_context=context) as pool:
+            return list(pool.map(extract, sources, extensions, chunksize=chunksize))
+    except BrokenProcessPool:
+        # Workers could not start, e.g. when __main__ cannot be re-imported; parse here instead
+        return [extract(source, extension) for source, extension in zip(sources, extensions)]
+
+
+def _extract_source_or_error(source: Source, file_extension: str, pdf_backend: str, limits: Dict
+                             ) -> Union[Tuple[str, Optional[str]], FileReadError]:
+    """Worker entry point; errors are returned so one bad file does not end the batch"""
+    try:
+        data = _source_bytes(source, limits.get('max_bytes'))
+        return _extract_text(data, file_extension, pdf_backend, limits)
+    except FileReadError as e:
+        return e
+
+
+def _checked_extension(file_path) -> str:
+    """Lower-case extension of a supported file"""
     file_extension = os.path.splitext(file_path)[1].lower()
-    
+    if file_extension not in SUPPORTED_EXTENSIONS:
+        raise FileReadError(f"Unsupported file format: {file_extension}")
+    return file_extension
+
+
+def _source_bytes(source: Source, max_bytes: Optional[int] = None) -> bytes:
+    """Bytes of a file given as a path or already in memory, refusing any over max_bytes"""
+    if isinstance(source, str):
+        return _read_bytes(source, max_bytes)
+    _check_size(len(source), max_bytes)
+    return source
+
+
+def _check_size(size: int, max_bytes: Optional[int]):
+    if max_bytes is not None and size > max_bytes:
+        raise FileReadError(f"File is {size:,} bytes, over the {max_bytes:,} byte limit")
+
+
+def _read_bytes(file_path, max_bytes: Optional[int] = None) -> bytes:
+    """Read a file, refusing one larger than max_bytes before loading it"""
+    try:
+        with open(file_path, 'rb') as file:
+            _check_size(os.fstat(file.fileno()).st_size, max_bytes)
+            return file.read()
+    except OSError as e:
+        raise FileReadError(f"Error reading file: {str(e)}") from e
+
+
+def _extractor(file_extension: str, pdf_backend: str, limits: Dict) -> str:
+    """Describe what extracts a file, so cached text is kept per PDF backend and limits"""
+    extractor = pdf_backend if file_extension == '.pdf' else file_extension
+    return f"{extractor}:{limits.get('max_pages')}:{limits.get('max_chars')}"
+
+
+def _extract_text(data: bytes, file_extension: str, pdf_backend: str,
+                  limits: Dict) -> Tuple[str, Optional[str]]:
+    """Extract text from a file's bytes by extension, within the page and character limits"""
+    max_chars = limits.get('max_chars')
     if file_extension == '.pdf':
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                content = ""
-                for page in pdf_reader.pages:
-                    content += page.extract_text()
-                return content
+            # Pages are parsed one at a time and parsing stops at the first limit reached
+            return extract_pdf_text(data, pdf_backend, limits.get('max_pages'), max_chars)
         except Exception as e:
-            st.error(f"Error reading PDF file: {str(e)}")
-            return None
-            
+            raise FileReadError(f"Error reading PDF file: {str(e)}") from e
+
     elif file_extension == '.docx':
         try:
-            content = docx2txt.process(file_path)
-            return content
+            content = docx2txt.process(io.BytesIO(data))
         except Exception as e:
-            st.error(f"Error reading DOCX file: {str(e)}")
-            return None
-            
+            raise FileReadError(f"Error reading DOCX file: {str(e)}") from e
+
     elif file_extension == '.txt':
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except Exception as e:
-            st.error(f"Error reading TXT file: {str(e)}")
-            return None
-    
+            content = data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise FileReadError(f"Error reading TXT file: {str(e)}") from e
+
     else:
-        st.error(f"Unsupported file format: {file_extension}")
-        return None
+        raise FileReadError(f"Unsupported file format: {file_extension}")
+
+    if max_chars is not None and len(content) > max_chars:
+        return content[:max_chars], "max_chars"
+    return content, None
+
 
 def save_uploaded_file(uploaded_file, directory):
     """Save uploaded file to specified directory"""
     if uploaded_file is not None:
         file_path = os.path.join(directory, uploaded_file.name)
         with open(file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+            f.write(uploaded_file.getvalue())
         return file_path
     return None
 
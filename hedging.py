@@ -0,0 +1,129 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+
+def _consume_result(task: asyncio.Task):
+    """Retrieve a losing request's outcome so it is not reported as never retrieved"""
+    if not task.cancelled():
+        task.exception()
+
+
+class HedgedCaller:
+    """Issue a duplicate request when a call runs past a latency percentile
+
+    Latencies are tracked per key (e.g. analysis dimension) over the last
+    window calls. Once min_samples are seen, a call still running after the
+    percentile latency gets a second, identical request; the first success
+    wins and the other is cancelled. Hedges are capped at budget times the
+    number of calls, bounding the extra cost.
+    """
+
+    def __init__(self, percentile: float = 95, budget: float = 0.05,
+                 min_samples: int = 20, window: int = 200):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.window = window
+        self._latencies: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "hedges": 0, "hedge_wins": 0, "budget_exhausted": 0}
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """Seconds to wait before hedging a call for key, or None if too few samples"""
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            return float(np.percentile(latencies, self.percentile))
+
+    def _record(self, key: str, latency: float):
+        with self._lock:
+            self._latencies.setdefault(key, deque(maxlen=self.window)).append(latency)
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self._stats["hedges"] < self.budget * self._stats["calls"]:
+                self._stats["hedges"] += 1
+                return True
+            self._stats["budget_exhausted"] += 1
+            return False
+
+    async def run(self, key: str, func: Callable[..., Awaitable], *args,
+                  on_hedge: Optional[Callable[[], None]] = None, **kwargs):
+        """Await func(*args, **kwargs), hedging it if it runs slow
+
+        on_hedge is called when a duplicate request is issued, e.g. to charge
+        it against a rate limit.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._stats["calls"] += 1
+        delay = self.hedge_delay(key)
+        start = loop.time()
+
+        tasks = [asyncio.ensure_future(func(*args, **kwargs))]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._take_budget():
+                    if on_hedge is not None:
+                        on_hedge()
+                    tasks.append(asyncio.ensure_future(func(*args, **kwargs)))
+
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None:
+                    break
+                if not pending:
+                    # Every request failed; surface the primary's error where possible
+                    failed = tasks[0] if tasks[0] in done else done.pop()
+                    raise failed.exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    task.add_done_callback(_consume_result)
+
+        # Only unhedged latencies describe the provider; a hedged call's is capped by the hedge
+        if len(tasks) == 1:
+            self._record(key, loop.time() - start)
+        elif winner is tasks[1]:
+            with self._lock:
+                self._stats["hedge_wins"] += 1
+        return winner.result()
+
+    def stats(self) -> Dict:
+        """Hedge counters and the current hedge delay per key"""
+        with self._lock:
+            keys = list(self._latencies)
+            stats = dict(self._stats)
+        stats["hedge_rate"] = stats["hedges"] / stats["calls"] if stats["calls"] else 0.0
+        stats["hedge_delays"] = {key: self.hedge_delay(key) for key in keys}
+        return stats
+
+
+_hedgers: Dict[Tuple[str, str], HedgedCaller] = {}
+_hedgers_lock = threading.Lock()
+
+
+def get_hedged_caller(provider: str, model_id: str, config: Optional[Dict] = None) -> HedgedCaller:
+    """Process-wide hedged caller for a provider/model, created on first use"""
+    key = (provider, model_id)
+    with _hedgers_lock:
+        if key not in _hedgers:
+            config = config or {}
+            _hedgers[key] = HedgedCaller(
+                percentile=config.get('percentile', 95),
+                budget=config.get('budget', 0.05),
+                min_samples=config.get('min_samples', 20),
+                window=config.get('window', 200)
+            )
+        return _hedgers[key]
@@ -0,0 +1,101 @@
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+# Keeps tokens such as c++, c#, node.js and ci/cd intact
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./\-]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it of on or our that the their this to was
+were will with you your we they he she i me my us who which what when where how all any can
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords"""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """Okapi BM25 index over a fixed set of documents, held as a sparse matrix
+
+    Term weights are precomputed at fit time, so scoring a query is a single
+    sparse matrix-vector product.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.vocabulary: Dict[str, int] = {}
+        self.weights: Optional[sparse.csr_matrix] = None
+
+    def fit(self, documents: Sequence[str]) -> "BM25Index":
+        """Build the index from document texts"""
+        indptr = [0]
+        indices = []
+        counts = []
+        for document in documents:
+            for term, count in Counter(tokenize(document)).items():
+                indices.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                counts.append(count)
+            indptr.append(len(indices))
+
+        term_frequencies = sparse.csr_matrix(
+            (np.asarray(counts, dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr)),
+            shape=(len(documents), len(self.vocabulary))
+        )
+
+        # Inverse document frequency with the usual +1 to keep it non-negative
+        n_documents = max(len(documents), 1)
+        document_frequency = np.bincount(term_frequencies.indices, minlength=len(self.vocabulary))
+        idf = np.log1p((n_documents - document_frequency + 0.5) / (document_frequency + 0.5))
+
+        # Saturated, length-normalized term frequency for every stored entry
+        document_lengths = np.asarray(term_frequencies.sum(axis=1)).ravel()
+        average_length = document_lengths.mean() if len(documents) else 0.0
+        length_norm = self.k1 * (1 - self.b + self.b * document_lengths / max(average_length, 1e-9))
+        row_norm = np.repeat(length_norm, np.diff(term_frequencies.indptr))
+
+        tf = term_frequencies.data
+        term_frequencies.data = (tf * (self.k1 + 1) / (tf + row_norm) * idf[term_frequencies.indices]).astype(np.float32)
+        self.weights = term_frequencies
+        return self
+
+    def score(self, query: str) -> np.ndarray:
+        """BM25 score of every indexed document against the query"""
+        if self.weights is None:
+            raise ValueError("Index has not been fitted")
+
+        query_vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for term, count in Counter(tokenize(query)).items():
+            index = self.vocabulary.get(term)
+            if index is not None:
+                query_vector[index] = count
+        return self.weights @ query_vector
+
+
+def shortlist(documents: Dict[str, str], query: str, top_k: Optional[int] = None,
+              min_score: Optional[float] = None) -> List[Tuple[str, float]]:
+    """Rank documents lexically against the query and keep the best matches
+
+    Scores are scaled to 0-100 relative to the best match. Documents are kept
+    if they are in the top_k and score at least min_score; either limit may
+    be omitted. Returns (document_id, score) pairs, best first.
+    """
+    document_ids = list(documents)
+    if not document_ids:
+        return []
+
+    scores = BM25Index().fit([documents[document_id] for document_id in document_ids]).score(query)
+    best = scores.max()
+    scores = scores / best * 100 if best > 0 else np.zeros_like(scores)
+
+    order = np.argsort(-scores, kind='stable')
+    if top_k is not None:
+        order = order[:top_k]
+    if min_score is not None:
+        order = order[scores[order] >= min_score]
+    return [(document_ids[index], float(scores[index])) for index in order]
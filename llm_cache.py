@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class LLMResultCache:
+    """Persistent SQLite cache for structured LLM analysis outputs
+
+    Entries are content-addressed: the key is a hash of everything that can
+    change the model's answer, so identical work is only paid for once.
+    """
+
+    def __init__(self, path: str = ".cache/llm_results.sqlite",
+                 max_entries: int = 50000, ttl_seconds: Optional[float] = 30 * 24 * 3600):
+        """Open (or create) the cache database at path"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL keeps lookups cheap while writes are in progress
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                dimension TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON results (last_access)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_prompt_version ON results (prompt_version)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model_id: str, temperature: float, prompt_version: str, dimension: str,
+                 job_description: str, resume_content: str) -> str:
+        """Build a content-addressed key for one analysis call"""
+        payload = json.dumps(
+            [model_id, temperature, prompt_version, dimension, job_description, resume_content],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached output for key, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or self._is_expired(row[1], now):
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return json.loads(row[0])
+
+    def put(self, key: str, value: Dict, dimension: str, prompt_version: str):
+        """Store an output and evict old entries if the cache is over its limits"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (key, dimension, prompt_version, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def invalidate(self, prompt_version: Optional[str] = None, dimension: Optional[str] = None) -> int:
+        """Delete entries for a prompt version and/or dimension; returns rows removed"""
+        clauses, params = [], []
+        if prompt_version is not None:
+            clauses.append("prompt_version = ?")
+            params.append(prompt_version)
+        if dimension is not None:
+            clauses.append("dimension = ?")
+            params.append(dimension)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            removed = self._conn.execute(f"DELETE FROM results{where}", params).rowcount
+            self._conn.commit()
+        return removed
+
+    def clear(self) -> int:
+        """Delete every entry"""
+        return self.invalidate()
+
+    def stats(self) -> Dict:
+        """Get hit/miss counters and current size"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries
+        }
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _evict(self, now: float):
+        """Drop expired entries, then the least recently used ones above max_entries"""
+        if self.ttl_seconds is not None:
+            self._conn.execute("DELETE FROM results WHERE created_at < ?", (now - self.ttl_seconds,))
+
+        if self.max_entries is not None:
+            entries = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            overflow = entries - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,)
+                )
@@ -1,34 +1,102 @@
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import yaml
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
 from pathlib import Path
 import os
+import threading
 from dotenv import load_dotenv
 
+# Parsed config files by absolute path, with the mtime they were parsed at
+_config_cache: Dict[str, Tuple[int, Dict]] = {}
+_config_lock = threading.Lock()
+
+# Chat model clients by (provider, model_id, temperature), shared process-wide so
+# their HTTP connection pools survive across agents, sessions and batches
+_clients: Dict[Tuple[str, str, float], Any] = {}
+_clients_lock = threading.Lock()
+
+_env_loaded = False
+
+
+def _load_env():
+    """Load .env once per process"""
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
+def load_config(config_path: str) -> Dict:
+    """Parse a YAML config file, reusing the parsed result until its mtime changes
+
+    The returned dict is shared; treat it as read-only.
+    """
+    path = os.path.abspath(config_path)
+    mtime = os.stat(path).st_mtime_ns
+    with _config_lock:
+        cached = _config_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    with open(path, 'r') as file:
+        config = yaml.safe_load(file)
+    with _config_lock:
+        _config_cache[path] = (mtime, config)
+    return config
+
+
 class ModelManager:
     def __init__(self, config_path: str = "config.yaml"):
-        """Initialize ModelManager with config file"""
-        load_dotenv()
-        
-        # Load configuration
-        with open(config_path, 'r') as file:
-            self.config = yaml.safe_load(file)
-        
-        self.models_config = self.config['models']
-        self.available_models = {
-            model_id: config 
-            for model_id, config in self.models_config.items() 
-            if config['available']
+        """Initialize ModelManager with config file
+
+        Cheap to construct: the config is parsed once per change on disk and
+        model clients are shared by every instance.
+        """
+        _load_env()
+        self.config_path = config_path
+        self._config = None
+        self._refresh()
+
+    def _refresh(self):
+        """Pick up config.yaml changes, rebuilding the derived model tables"""
+        config = load_config(self.config_path)
+        if config is self._config:
+            return
+
+        self._config = config
+        self._models_config = config['models']
+        self._available_models = {
+            model_id: model_config
+            for model_id, model_config in self._models_config.items()
+            if model_config['available']
         }
-        
+
         # Get default model
-        self.default_model_id = next(
-            (model_id for model_id, config in self.models_config.items() 
-             if config['available'] and config['default']),
+        self._default_model_id = next(
+            (model_id for model_id, model_config in self._models_config.items()
+             if model_config['available'] and model_config['default']),
             None
         )
 
+    @property
+    def config(self) -> Dict:
+        self._refresh()
+        return self._config
+
+    @property
+    def models_config(self) -> Dict:
+        self._refresh()
+        return self._models_config
+
+    @property
+    def available_models(self) -> Dict:
+        self._refresh()
+        return self._available_models
+
+    @property
+    def default_model_id(self) -> Optional[str]:
+        self._refresh()
+        return self._default_model_id
+
     def get_model_names(self) -> Dict[str, str]:
         """Get dictionary of available model IDs and their display names"""
         return {
@@ -44,8 +112,56 @@ class ModelManager:
         """Get pricing information for a specific model"""
         return self.models_config[model_id].get('pricing', {})
 
+    def get_rate_limits(self, model_id: str) -> Dict[str, float]:
+        """Get requests/tokens per minute limits for a specific model"""
+        return self.models_config[model_id].get('rate_limits', {})
+
+    def get_retry_config(self) -> Dict:
+        """Get retry and backoff settings for transient LLM errors"""
+        return self.config.get('retry', {})
+
+    def get_concurrency_config(self) -> Dict:
+        """Get settings for the adaptive (AIMD) limit on in-flight LLM calls"""
+        return self.config.get('concurrency', {})
+
+    def get_hedging_config(self) -> Dict:
+        """Get settings for hedging slow LLM calls with a duplicate request"""
+        return self.config.get('hedging', {})
+
+    def get_timeout_config(self) -> Dict:
+        """Get per-dimension and per-resume analysis deadlines"""
+        return self.config.get('timeouts', {})
+
+    def get_extraction_config(self) -> Dict:
+        """Get worker count and cache settings for file text extraction"""
+        return self.config.get('extraction', {})
+
+    def get_tracing_config(self) -> Dict:
+        """Get the span exporter for pipeline tracing"""
+        return self.config.get('tracing', {})
+
+    def get_cache_config(self) -> Dict:
+        """Get settings for the persistent LLM result cache"""
+        return self.config.get('cache', {})
+
+    def get_cascade_config(self) -> Dict:
+        """Get the screening/premium model cascade policy"""
+        return self.config.get('cascade', {})
+
+    def get_gating_config(self) -> Dict:
+        """Get the early-exit gating policy"""
+        return self.config.get('gating', {})
+
+    def get_cheapest_model_id(self) -> Optional[str]:
+        """Get the available model with the lowest combined input and output price"""
+        return min(
+            self.available_models,
+            key=lambda model_id: sum(self.get_model_pricing(model_id).values()),
+            default=None
+        )
+
     def initialize_model(self, model_id: Optional[str] = None) -> any:
-        """Initialize and return the specified model or default model"""
+        """Return the shared client for the specified model or default model, creating it once"""
         if model_id is None:
             model_id = self.default_model_id
         
@@ -54,14 +170,28 @@ class ModelManager:
         
         config = self.models_config[model_id]
         provider = config['provider']
-        
+        key = (provider, config['model_id'], config['temperature'])
+
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = self._create_client(provider, config)
+        return client
+
+    def _create_client(self, provider: str, config: Dict) -> Any:
+        """Construct a chat model client for a model's config entry
+
+        Provider SDKs are imported here, so only the providers in use are loaded.
+        """
         if provider == 'google':
+            from langchain_google_genai import ChatGoogleGenerativeAI
             return ChatGoogleGenerativeAI(
                 model=config['model_id'],
                 temperature=config['temperature'],
                 google_api_key=os.getenv("GOOGLE_API_KEY")
             )
         elif provider == 'openai':
+            from langchain_openai import ChatOpenAI
             return ChatOpenAI(
                 model=config['model_id'],
                 temperature=config['temperature'],
@@ -0,0 +1,144 @@
+import importlib.util
+import io
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# A page loader returns one page's text when called. Backends yield loaders
+# lazily, so callers that stop early never parse the remaining pages.
+PageLoader = Callable[[], str]
+
+# name -> (importable module, generator of page loaders from PDF bytes).
+# Libraries are imported on first use, so only the backend chosen is loaded.
+PDF_BACKENDS: Dict[str, Tuple[str, Callable[[bytes], Iterator[PageLoader]]]] = {}
+
+# Tried in order by "auto": fastest first, PyPDF2 (a required dependency) last
+BACKEND_PREFERENCE = ["pypdfium2", "pymupdf", "pdfminer", "pypdf", "pypdf2"]
+FALLBACK_BACKEND = "pypdf2"
+
+
+def register_pdf_backend(name: str, module: str):
+    """Register a page-loader generator under name, available when module can be imported"""
+    def decorator(func: Callable[[bytes], Iterator[PageLoader]]):
+        PDF_BACKENDS[name] = (module, func)
+        return func
+    return decorator
+
+
+def _pypdfium2_page_text(document, index: int) -> str:
+    page = document[index]
+    text_page = page.get_textpage()
+    try:
+        return text_page.get_text_range()
+    finally:
+        text_page.close()
+        page.close()
+
+
+@register_pdf_backend("pypdfium2", "pypdfium2")
+def _pages_pypdfium2(data: bytes) -> Iterator[PageLoader]:
+    import pypdfium2
+
+    document = pypdfium2.PdfDocument(data)
+    try:
+        for index in range(len(document)):
+            yield partial(_pypdfium2_page_text, document, index)
+    finally:
+        document.close()
+
+
+@register_pdf_backend("pymupdf", "fitz")
+def _pages_pymupdf(data: bytes) -> Iterator[PageLoader]:
+    import fitz
+
+    with fitz.open(stream=data, filetype="pdf") as document:
+        for page in document:
+            yield page.get_text
+
+
+def _pdfminer_page_text(page_layout) -> str:
+    from pdfminer.layout import LTTextContainer
+
+    return "".join(element.get_text() for element in page_layout if isinstance(element, LTTextContainer))
+
+
+@register_pdf_backend("pdfminer", "pdfminer")
+def _pages_pdfminer(data: bytes) -> Iterator[PageLoader]:
+    from pdfminer.high_level import extract_pages
+
+    # pdfminer lays out each page as it is yielded; only text assembly is deferred
+    for page_layout in extract_pages(io.BytesIO(data)):
+        yield partial(_pdfminer_page_text, page_layout)
+
+
+def _pypdf_page_text(page) -> str:
+    return page.extract_text() or ""
+
+
+@register_pdf_backend("pypdf", "pypdf")
+def _pages_pypdf(data: bytes) -> Iterator[PageLoader]:
+    from pypdf import PdfReader
+
+    for page in PdfReader(io.BytesIO(data)).pages:
+        yield partial(_pypdf_page_text, page)
+
+
+@register_pdf_backend("pypdf2", "PyPDF2")
+def _pages_pypdf2(data: bytes) -> Iterator[PageLoader]:
+    from PyPDF2 import PdfReader
+
+    for page in PdfReader(io.BytesIO(data)).pages:
+        yield partial(_pypdf_page_text, page)
+
+
+def available_pdf_backends() -> List[str]:
+    """Registered backends whose library is installed, in preference order"""
+    ordered = BACKEND_PREFERENCE + [name for name in PDF_BACKENDS if name not in BACKEND_PREFERENCE]
+    return [
+        name for name in ordered
+        if name in PDF_BACKENDS and importlib.util.find_spec(PDF_BACKENDS[name][0]) is not None
+    ]
+
+
+@lru_cache(maxsize=None)
+def resolve_pdf_backend(name: str = "auto") -> str:
+    """Concrete backend for a configured name
+
+    "auto" picks the first available backend in preference order; a named
+    backend that is not installed falls back to PyPDF2.
+    """
+    if name != "auto" and name not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend: {name}. Choose from auto, {', '.join(PDF_BACKENDS)}")
+    available = available_pdf_backends()
+    if name == "auto":
+        return available[0] if available else FALLBACK_BACKEND
+    if name not in available:
+        print(f"PDF backend {name} is not installed; using {FALLBACK_BACKEND}")
+        return FALLBACK_BACKEND
+    return name
+
+
+def extract_pdf_text(data: bytes, backend: str = "auto", max_pages: Optional[int] = None,
+                     max_chars: Optional[int] = None) -> Tuple[str, Optional[str]]:
+    """Extract a PDF's text page by page, stopping once a limit is reached
+
+    Returns the text and which limit truncated it ("max_pages" or
+    "max_chars"), or None if the whole document was read.
+    """
+    pages = PDF_BACKENDS[resolve_pdf_backend(backend)][1](data)
+    parts, chars, truncated = [], 0, None
+    try:
+        for number, load_page in enumerate(pages):
+            if max_pages is not None and number >= max_pages:
+                truncated = "max_pages"
+                break
+            text = load_page()
+            parts.append(text)
+            chars += len(text)
+            if max_chars is not None and chars > max_chars:
+                truncated = "max_chars"
+                break
+    finally:
+        pages.close()
+    # A single join is linear in the text length, unlike repeated concatenation
+    content = "".join(parts)
+    return (content[:max_chars] if truncated == "max_chars" else content), truncated
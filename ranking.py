@@ -0,0 +1,65 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Components in the order used for score matrices
+COMPONENTS = ["education", "skills", "experience", "tools", "industry", "role", "preferences"]
+
+
+def build_score_frame(analyzed_results: List[Dict]) -> pd.DataFrame:
+    """Collect raw component scores into a (resumes x components) frame
+
+    Components missing from a result, or not completed (e.g. skipped by
+    gating), are stored as NaN so they are left out of that resume's
+    weighted total, as in aggregate_results.
+    """
+    rows = [
+        {
+            component: data['score']
+            for component, data in result['component_scores'].items()
+            if data.get('status', 'completed') == 'completed'
+        }
+        for result in analyzed_results
+    ]
+    return pd.DataFrame(rows, columns=COMPONENTS, dtype=float)
+
+
+def compute_total_scores(score_frame: pd.DataFrame, weights: Dict[str, float]) -> np.ndarray:
+    """Weighted total score per resume, renormalized over available components"""
+    weight_vector = np.array([weights.get(component, 0.0) for component in score_frame.columns])
+    scores = score_frame.to_numpy()
+    available = ~np.isnan(scores)
+
+    weighted_sum = np.where(available, scores, 0.0) @ weight_vector
+    available_weight = available @ weight_vector
+    return np.divide(
+        weighted_sum, available_weight,
+        out=np.zeros_like(weighted_sum),
+        where=available_weight > 0
+    )
+
+
+def rerank_results(analyzed_results: List[Dict], weights: Dict[str, float],
+                   score_frame: Optional[pd.DataFrame] = None) -> Tuple[List[Dict], pd.DataFrame]:
+    """Re-score and re-sort analyzed results under new weights without calling the LLM
+
+    score_frame must be row-aligned with analyzed_results; it is built if not
+    given. Returns the results and frame, both sorted best first.
+    """
+    if score_frame is None:
+        score_frame = build_score_frame(analyzed_results)
+
+    totals = compute_total_scores(score_frame, weights)
+    order = np.argsort(-totals, kind='stable')
+
+    reranked = []
+    for idx in order:
+        result = analyzed_results[idx]
+        result['total_score'] = float(totals[idx])
+        result['weights_used'] = dict(weights)
+        for component, data in result['component_scores'].items():
+            data['weight'] = weights.get(component, 0.0)
+        reranked.append(result)
+
+    return reranked, score_frame.iloc[order].reset_index(drop=True)
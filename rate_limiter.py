@@ -0,0 +1,196 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+# Provider SDK exception names that signal a transient failure
+RETRYABLE_ERROR_NAMES = {
+    "RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError",
+    "ResourceExhausted", "ServiceUnavailable", "DeadlineExceeded", "TooManyRequests",
+    "TimeoutError", "ConnectError", "ReadTimeout",
+}
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP status code carried by a provider exception, if any"""
+    for source in (error, getattr(error, 'response', None)):
+        for attribute in ('status_code', 'code', 'status'):
+            value = getattr(source, attribute, None)
+            value = value() if callable(value) else value
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an LLM call failure is transient (429, 5xx, timeouts, dropped connections)"""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    if _status_code(error) in RETRYABLE_STATUS_CODES:
+        return True
+    return any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the provider asked us to wait, from a Retry-After header"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate
+
+    Callers reserve capacity up front and are told how long to wait; the
+    balance may go negative so that waiters queue fairly behind each other.
+    """
+
+    def __init__(self, per_minute: float):
+        if per_minute <= 0:
+            raise ValueError("Bucket rate must be positive")
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = float(per_minute)
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take amount from the bucket, returning seconds to wait before using it"""
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+        self.available -= min(amount, self.capacity)
+        return max(0.0, -self.available / self.rate)
+
+    def refund(self, amount: float):
+        """Return (or, if negative, charge) capacity after the fact"""
+        self.available = min(self.capacity, self.available + amount)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter with retry and backoff
+
+    One limiter is shared by every agent using the same provider/model (see
+    get_rate_limiter), so concurrent resumes draw from a single quota.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None,
+                 tokens_per_minute: Optional[float] = None, max_retries: int = 5,
+                 base_delay: float = 1.0, max_delay: float = 60.0):
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = {"calls": 0, "retries": 0, "failures": 0, "throttled_seconds": 0.0}
+        self._lock = threading.Lock()
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        """Reserve one request and the estimated tokens, returning the wait in seconds"""
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self.request_bucket is not None:
+                wait = max(wait, self.request_bucket.reserve(1, now))
+            if self.token_bucket is not None:
+                wait = max(wait, self.token_bucket.reserve(estimated_tokens, now))
+            self.stats["throttled_seconds"] += wait
+            return wait
+
+    def charge(self, estimated_tokens: int):
+        """Count an extra request (e.g. a hedge) against the limits without waiting for capacity"""
+        self._reserve(estimated_tokens)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int):
+        """Correct the token bucket once the real usage of a call is known"""
+        if self.token_bucket is not None:
+            with self._lock:
+                self.token_bucket.refund(estimated_tokens - actual_tokens)
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Jittered exponential backoff, honouring Retry-After when given"""
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _should_retry(self, attempt: int, error: Exception) -> bool:
+        with self._lock:
+            if attempt < self.max_retries and is_retryable(error):
+                self.stats["retries"] += 1
+                return True
+            self.stats["failures"] += 1
+            return False
+
+    def call(self, func: Callable, *args, estimated_tokens: int = 0,
+             call_stats: Optional[Dict] = None, **kwargs):
+        """Call func under the limits, retrying transient failures
+
+        If call_stats is given, it receives this call's attempts and seconds spent throttled.
+        """
+        call_stats = {} if call_stats is None else call_stats
+        call_stats.update(attempts=0, throttled_seconds=0.0)
+        attempt = 0
+        while True:
+            wait = self._reserve(estimated_tokens)
+            call_stats["attempts"] += 1
+            call_stats["throttled_seconds"] += wait
+            time.sleep(wait)
+            with self._lock:
+                self.stats["calls"] += 1
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if not self._should_retry(attempt, e):
+                    raise
+                time.sleep(self._backoff(attempt, e))
+                attempt += 1
+
+    async def acall(self, func: Callable[..., Awaitable], *args, estimated_tokens: int = 0,
+                    call_stats: Optional[Dict] = None, **kwargs):
+        """Async variant of call; func must return an awaitable"""
+        call_stats = {} if call_stats is None else call_stats
+        call_stats.update(attempts=0, throttled_seconds=0.0)
+        attempt = 0
+        while True:
+            wait = self._reserve(estimated_tokens)
+            call_stats["attempts"] += 1
+            call_stats["throttled_seconds"] += wait
+            await asyncio.sleep(wait)
+            with self._lock:
+                self.stats["calls"] += 1
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if not self._should_retry(attempt, e):
+                    raise
+                await asyncio.sleep(self._backoff(attempt, e))
+                attempt += 1
+
+
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model_id: str, rate_limits: Optional[Dict] = None,
+                     retry: Optional[Dict] = None) -> RateLimiter:
+    """Process-wide limiter for a provider/model, created on first use"""
+    key = (provider, model_id)
+    with _limiters_lock:
+        if key not in _limiters:
+            rate_limits = rate_limits or {}
+            retry = retry or {}
+            _limiters[key] = RateLimiter(
+                requests_per_minute=rate_limits.get('requests_per_minute'),
+                tokens_per_minute=rate_limits.get('tokens_per_minute'),
+                max_retries=retry.get('max_retries', 5),
+                base_delay=retry.get('base_delay', 1.0),
+                max_delay=retry.get('max_delay', 60.0)
+            )
+        return _limiters[key]
@@ -1,13 +1,28 @@
-from typing import TypedDict, Dict, Annotated,Optional
+from typing import TypedDict, Dict, Annotated,Optional, AsyncIterator, Tuple, List, Callable
 from pydantic import BaseModel, Field, field_validator
 from langgraph.graph import StateGraph, START, END
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
 import os
 from dotenv import load_dotenv
 import operator
-from functools import reduce
+import asyncio
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from functools import reduce, partial
 from model_manager import ModelManager
+from llm_cache import LLMResultCache
+from rate_limiter import get_rate_limiter
+from concurrency import get_concurrency_limiter
+from hedging import get_hedged_caller
+from tracing import tracer, current_trace_id
+from token_accounting import count_tokens, usage_from_message, calculate_cost
+from resume_sections import segment_resume, sections_for_component
+
+# Bump whenever a prompt or output schema changes so cached results are not reused
+PROMPT_VERSION = "1"
 
 # Pydantic models for structured outputs
 class EducationDetails(BaseModel):
@@ -108,6 +123,229 @@ class PreferencesMatchDetails(BaseModel):
             raise ValueError("Score must be between 0 and 100")
         return v
 
+class FusedAnalysisDetails(BaseModel):
+    """Combined scores and explanations for all assessment dimensions in a single response"""
+    education: EducationDetails = Field(description="Education assessment")
+    skills: SkillsDetails = Field(description="Skills assessment")
+    experience: ExperienceDetails = Field(description="Work experience assessment")
+    tools: ToolsMatchDetails = Field(description="Tools and technology assessment")
+    industry: IndustryMatchDetails = Field(description="Industry fit assessment")
+    role: RoleMatchDetails = Field(description="Role requirements assessment")
+    preferences: PreferencesMatchDetails = Field(description="Additional preferences assessment")
+
+class JobRequirementsProfile(BaseModel):
+    """Compact structured requirements extracted from a job description"""
+    title: str = Field(description="Job title")
+    required_skills: List[str] = Field(description="Required skills, as short phrases")
+    tools: List[str] = Field(description="Required tools and technologies")
+    min_years_experience: Optional[float] = Field(description="Minimum years of experience, if stated")
+    degree: str = Field(description="Required or preferred degree and field, or 'not specified'")
+    industry: str = Field(description="Industry or domain of the role")
+    location: str = Field(description="Location and remote/onsite requirements")
+    leadership: str = Field(description="Leadership or people management expectations")
+    responsibilities: List[str] = Field(description="Key responsibilities, as short phrases")
+
+def render_job_profile(profile: JobRequirementsProfile) -> str:
+    """Render a requirements profile as compact prompt text"""
+    years = profile.min_years_experience
+    return "\n".join([
+        f"Title: {profile.title}",
+        f"Required skills: {', '.join(profile.required_skills)}",
+        f"Tools: {', '.join(profile.tools)}",
+        f"Minimum years of experience: {years:g}" if years is not None else "Minimum years of experience: not specified",
+        f"Degree: {profile.degree}",
+        f"Industry: {profile.industry}",
+        f"Location: {profile.location}",
+        f"Leadership: {profile.leadership}",
+        f"Responsibilities: {'; '.join(profile.responsibilities)}"
+    ])
+
+# Sub-scores averaged into each component score
+COMPONENT_SCORE_FIELDS = {
+    "education": ["degree_relevance", "education_level", "academic_achievements", "certifications"],
+    "skills": ["technical_skills", "soft_skills", "tools_tech", "domain_expertise"],
+    "experience": ["years_experience", "role_relevance", "industry_fit", "achievements"],
+    "tools": ["required_tools_proficiency", "tool_experience_years", "tool_diversity", "tool_certifications"],
+    # industry_experience is counted twice in the industry score
+    "industry": ["industry_experience", "industry_experience", "industry_knowledge",
+                 "industry_projects", "industry_network"],
+    "role": ["role_responsibilities", "leadership_requirements", "project_management", "team_collaboration"],
+    "preferences": ["work_style", "location_match", "culture_fit", "growth_potential"]
+}
+
+# System and human prompts for each single-dimension analysis node
+ANALYSIS_PROMPTS = {
+    "education": (
+        EducationDetails,
+        """You are a resume analyzer specializing in educational qualifications. 
+        Analyze the resume and provide scores and detailed explanations for educational components.""",
+        """Analyze these educational qualifications:
+        Job Description: {job_description}
+        Resume Content: {resume_content}
+        Provide:
+        1. Scores (0-100) for:
+           - Degree relevance to the position
+           - Education level match with requirements
+           - Academic achievements
+           - Relevant certifications
+        2. A detailed explanation of your analysis"""
+    ),
+    "skills": (
+        SkillsDetails,
+        """You are a resume analyzer specializing in skills assessment.""",
+        """Analyze these skills:
+        Job Description: {job_description}
+        Resume Content: {resume_content}
+        Provide:
+        1. Scores (0-100) for:
+           - Technical skills match
+           - Soft skills match
+           - Tools and technologies proficiency
+           - Domain expertise
+        2. A detailed explanation of your analysis"""
+    ),
+    "experience": (
+        ExperienceDetails,
+        """You are a resume analyzer specializing in work experience assessment.""",
+        """Analyze this work experience:
+        Job Description: {job_description}
+        Resume Content: {resume_content}
+        Provide:
+        1. Scores (0-100) for:
+           - Years of experience relevance
+           - Role relevance
+           - Industry fit
+           - Notable achievements
+        2. A detailed explanation of your analysis"""
+    ),
+    "tools": (
+        ToolsMatchDetails,
+        """You are a resume analyzer specializing in tools and technology assessment.""",
+        """Analyze the tools match:
+        Job Description: {job_description}
+        Resume Content: {resume_content}
+        Provide:
+        1. Scores (0-100) for:
+           - Required tools proficiency
+           - Years of experience with tools
+           - Range of tools known
+           - Tool certifications
+        2. A detailed explanation of your analysis"""
+    ),
+    "industry": (
+        IndustryMatchDetails,
+        """You are a resume analyzer specializing in industry assessment.""",
+        """Analyze the industry match:
+        Job Description: {job_description}
+        Resume Content: {resume_content}
+        Provide:
+        1. Scores (0-100) for:
+           - Industry experience
+           - Industry knowledge
+           - Industry projects
+           - Industry networking
+        2. A detailed explanation of your analysis"""
+    ),
+    "role": (
+        RoleMatchDetails,
+        """You are a resume analyzer specializing in role requirements.""",
+        """Analyze the role match:
+        Job Description: {job_description}
+        Resume Content: {resume_content}
+        Provide:
+        1. Scores (0-100) for:
+           - Role responsibilities
+           - Leadership requirements
+           - Project management
+           - Team collaboration
+        2. A detailed explanation of your analysis"""
+    ),
+    "preferences": (
+        PreferencesMatchDetails,
+        """You are a resume analyzer specializing in preferences assessment.""",
+        """Analyze the preferences match:
+        Job Description: {job_description}
+        Resume Content: {resume_content}
+        Provide:
+        1. Scores (0-100) for:
+           - Work style compatibility
+           - Location preferences match
+           - Cultural fit indicators
+           - Growth potential
+        2. A detailed explanation of your analysis"""
+    ),
+}
+
+# Prompts for the fused node, which scores every dimension in one call
+FUSED_SYSTEM_MESSAGE = """You are a resume analyzer. Assess the resume against the job description
+        across education, skills, experience, tools, industry, role and preferences, and provide
+        scores and detailed explanations for every dimension."""
+
+FUSED_HUMAN_MESSAGE = """Analyze this candidate:
+        Job Description: {job_description}
+        Resume Content: {resume_content}
+        Provide, for each dimension, scores (0-100) and a detailed explanation of your analysis:
+        1. Education:
+           - Degree relevance to the position
+           - Education level match with requirements
+           - Academic achievements
+           - Relevant certifications
+        2. Skills:
+           - Technical skills match
+           - Soft skills match
+           - Tools and technologies proficiency
+           - Domain expertise
+        3. Experience:
+           - Years of experience relevance
+           - Role relevance
+           - Industry fit
+           - Notable achievements
+        4. Tools:
+           - Required tools proficiency
+           - Years of experience with tools
+           - Range of tools known
+           - Tool certifications
+        5. Industry:
+           - Industry experience
+           - Industry knowledge
+           - Industry projects
+           - Industry networking
+        6. Role:
+           - Role responsibilities
+           - Leadership requirements
+           - Project management
+           - Team collaboration
+        7. Preferences:
+           - Work style compatibility
+           - Location preferences match
+           - Cultural fit indicators
+           - Growth potential"""
+
+# Prompts for digesting a job description into a requirements profile
+JOB_PROFILE_SYSTEM_MESSAGE = """You are a recruiting assistant that condenses job descriptions
+        into compact requirement profiles. Use short phrases and omit boilerplate."""
+
+JOB_PROFILE_HUMAN_MESSAGE = """Extract the hiring requirements from this job description:
+        Job Description: {job_description}"""
+
+# Token usage reported for results served from the cache
+CACHED_USAGE = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0, "source": "cache"}
+
+# Output tokens reserved against the tokens-per-minute budget before a call's real usage is known
+EXPECTED_OUTPUT_TOKENS = 400
+
+EXECUTION_STRATEGIES = ("parallel", "sequential", "bounded")
+
+DEFAULT_WEIGHTS = {
+    "education": 0.15,
+    "skills": 0.20,
+    "experience": 0.20,
+    "tools": 0.15,
+    "industry": 0.10,
+    "role": 0.15,
+    "preferences": 0.05
+}
+
 def max_reducer(a: float, b: float) -> float:
     """Binary reducer to take maximum of two values"""
     return max(a, b)
@@ -120,6 +358,10 @@ class ResumeState(TypedDict):
     """State definition with proper annotations for concurrent updates"""
     job_description: str
     resume_content: str
+    resume_sections: Dict[str, str]
+    job_profile: str
+    screened_out: bool
+    gate_score: Optional[float]
     education_score: Annotated[float, max_reducer]
     skills_score: Annotated[float, max_reducer]
     experience_score: Annotated[float, max_reducer]
@@ -128,45 +370,230 @@ class ResumeState(TypedDict):
     role_score: Annotated[float, max_reducer]
     preferences_score: Annotated[float, max_reducer]
     analysis_details: Annotated[Dict, merge_dicts]
+    component_status: Annotated[Dict, merge_dicts]
+    deadline: Optional[float]
     total_input_tokens: Annotated[int, operator.add]
     total_output_tokens: Annotated[int, operator.add]
+    node_token_usage: Annotated[Dict, merge_dicts]
+    node_traces: Annotated[Dict, merge_dicts]
+    started_at: float
     final_analysis: dict
     weights: Dict[str, float]
 
 class ResumeAnalysisAgent:
-    def __init__(self, model_id: Optional[str] = None):
-        """Initialize agent with specified model or default model"""
+    def __init__(self, model_id: Optional[str] = None, fused: bool = False,
+                 cache: Optional[LLMResultCache] = None, section_routing: bool = False,
+                 job_digest: bool = False, gating: Optional[Dict] = None,
+                 timeouts: Optional[Dict] = None, execution: str = "parallel",
+                 max_in_flight: Optional[int] = None):
+        """Initialize agent with specified model or default model
+
+        When fused is True, all dimensions are scored by a single LLM call
+        instead of seven parallel calls. When a cache is given, structured
+        outputs are looked up there before calling the LLM. When
+        section_routing is True, the resume is segmented once and each
+        analyzer receives only the sections it needs. When job_digest is True,
+        the job description is condensed once into a requirements profile
+        that replaces the raw text in every prompt. gating, e.g.
+        {"first_tier": ["skills", "experience"], "threshold": 40}, runs the
+        first tier before the rest and screens out resumes whose weighted
+        first-tier score is below the threshold, skipping remaining analyzers.
+        timeouts, e.g. {"dimension_seconds": 60, "resume_seconds": 180},
+        defaults to the timeouts section of config.yaml; dimensions that miss
+        their deadline are recorded as timed out and left out of the total.
+        execution chooses how one resume's dimensions run: "parallel" (all at
+        once), "sequential" (one at a time) or "bounded" (at most
+        max_in_flight at once), trading per-resume fan-out against how many
+        resumes can share the provider quota.
+        """
         self.model_manager = ModelManager()
         self.model_id = model_id or self.model_manager.get_default_model_id()
         self.llm = self.model_manager.initialize_model(self.model_id)
-
-        # Initialize workflow
-        self.workflow = StateGraph(ResumeState)
-        
-        # Add all analysis nodes
-        self.workflow.add_node("analyze_education", self.analyze_education)
-        self.workflow.add_node("analyze_skills", self.analyze_skills)
-        self.workflow.add_node("analyze_experience", self.analyze_experience)
-        self.workflow.add_node("analyze_tools", self.analyze_tools)
-        self.workflow.add_node("analyze_industry", self.analyze_industry)
-        self.workflow.add_node("analyze_role", self.analyze_role)
-        self.workflow.add_node("analyze_preferences", self.analyze_preferences)
-        self.workflow.add_node("aggregate_results", self.aggregate_results)
-
-        # Set up parallel execution paths
-        for node in ["analyze_education", "analyze_skills", "analyze_experience",
-                    "analyze_tools", "analyze_industry", "analyze_role",
-                    "analyze_preferences"]:
-            self.workflow.add_edge(START, node)
-            self.workflow.add_edge(node, "aggregate_results")
+        self.fused = fused
+        self.cache = cache
+        self.section_routing = section_routing
+        self.job_digest = job_digest
+        self.gating = self._validate_gating(gating) if gating and not fused else None
+        self.timeouts = timeouts if timeouts is not None else self.model_manager.get_timeout_config()
+        self.pricing = self.model_manager.get_model_pricing(self.model_id)
+
+        # Every LLM call for this provider/model draws on one shared quota, with retries
+        model_config = self.model_manager.models_config[self.model_id]
+        self.rate_limiter = get_rate_limiter(
+            model_config['provider'],
+            model_config['model_id'],
+            self.model_manager.get_rate_limits(self.model_id),
+            self.model_manager.get_retry_config()
+        )
+        # Adaptive cap on calls in flight for this provider/model, shared the same way
+        concurrency_config = self.model_manager.get_concurrency_config()
+        self.concurrency = get_concurrency_limiter(
+            model_config['provider'], model_config['model_id'], concurrency_config
+        ) if concurrency_config.get('enabled', False) else None
+        # Opt-in duplicate requests for slow async calls
+        hedging_config = self.model_manager.get_hedging_config()
+        self.hedger = get_hedged_caller(
+            model_config['provider'], model_config['model_id'], hedging_config
+        ) if hedging_config.get('enabled', False) else None
+
+        # Compile one structured runnable per dimension up front and reuse it for every call
+        self.chains = {}
+        self.details_models = {}
+        self.prompt_tokens = {}
+        analysis_prompts = {
+            **ANALYSIS_PROMPTS,
+            "fused": (FusedAnalysisDetails, FUSED_SYSTEM_MESSAGE, FUSED_HUMAN_MESSAGE)
+        }
+        for dimension, (details_model, system_message, human_message) in analysis_prompts.items():
+            prompt = ChatPromptTemplate.from_messages([
+                ("system", system_message),
+                ("human", human_message)
+            ])
+            # include_raw keeps the provider response so its usage metadata can be read
+            self.chains[dimension] = prompt | self.llm.with_structured_output(details_model, include_raw=True)
+            self.details_models[dimension] = details_model
+            # Template tokens, used only when the provider reports no usage
+            self.prompt_tokens[dimension] = count_tokens(
+                system_message + human_message.format(job_description="", resume_content="")
+            )
+
+        # Job profiles by job description hash, shared by every resume in a batch
+        job_profile_prompt = ChatPromptTemplate.from_messages([
+            ("system", JOB_PROFILE_SYSTEM_MESSAGE),
+            ("human", JOB_PROFILE_HUMAN_MESSAGE)
+        ])
+        self.job_profile_chain = job_profile_prompt | self.llm.with_structured_output(
+            JobRequirementsProfile, include_raw=True
+        )
+        self.prompt_tokens["job_profile"] = count_tokens(
+            JOB_PROFILE_SYSTEM_MESSAGE + JOB_PROFILE_HUMAN_MESSAGE.format(job_description="")
+        )
+        self._job_profiles = {}
+        self._job_profiles_lock = threading.Lock()
+
+        # Compiled graphs by topology, built on first use; bounded reuses the parallel graph
+        self.execution, self.max_in_flight = self._validate_execution(execution, max_in_flight)
+        self._graphs = {}
+        self._graphs_lock = threading.Lock()
+        self.app = self._graph(self.execution)
+    
+    
+    def _graph(self, execution: str):
+        """Compiled graph for an execution strategy, built once per agent"""
+        topology = "sequential" if execution == "sequential" else "parallel"
+        with self._graphs_lock:
+            if topology not in self._graphs:
+                self._graphs[topology] = self._build_graph(sequential=topology == "sequential")
+            return self._graphs[topology]
+
+    def _connect(self, workflow: StateGraph, source: str, nodes: List[str], sequential: bool) -> List[str]:
+        """Wire nodes after source, in a chain or as a fan-out, returning the nodes to fan in from"""
+        if sequential:
+            for previous, node in zip([source] + nodes, nodes):
+                workflow.add_edge(previous, node)
+            return nodes[-1:]
+        for node in nodes:
+            workflow.add_edge(source, node)
+        return nodes
+
+    def _build_graph(self, sequential: bool):
+        """Build and compile the analysis graph, running dimensions in parallel or one at a time"""
+        workflow = StateGraph(ResumeState)
+        workflow.add_node("aggregate_results", self.aggregate_results)
+
+        # Digest the job description before any analysis when enabled
+        fan_out_from = START
+        if self.job_digest:
+            workflow.add_node("digest_job_description", RunnableLambda(
+                self.digest_job_description_node, afunc=self.adigest_job_description_node
+            ))
+            workflow.add_edge(START, "digest_job_description")
+            fan_out_from = "digest_job_description"
+
+        if self.fused:
+            # Single combined analysis node
+            workflow.add_node("analyze_all", RunnableLambda(self.analyze_all, afunc=self.aanalyze_all))
+            workflow.add_edge(fan_out_from, "analyze_all")
+            workflow.add_edge("analyze_all", "aggregate_results")
+        else:
+            # Add all analysis nodes, each with a native async variant for ainvoke
+            for component in ANALYSIS_PROMPTS:
+                node = f"analyze_{component}"
+                workflow.add_node(node, RunnableLambda(
+                    getattr(self, node),
+                    afunc=partial(self._aanalyze_component, component)
+                ))
+
+            # Segment the resume once before the fan-out when routing sections
+            if self.section_routing:
+                workflow.add_node("segment_resume", self.segment_resume)
+                workflow.add_edge(fan_out_from, "segment_resume")
+                fan_out_from = "segment_resume"
+
+            analysis_nodes = [f"analyze_{component}" for component in ANALYSIS_PROMPTS]
+            if self.gating:
+                # Run the first tier, then only continue if the gate lets the resume through
+                first_tier = [f"analyze_{component}" for component in self.gating["first_tier"]]
+                second_tier = [node for node in analysis_nodes if node not in first_tier]
+                workflow.add_node("gate", self.gate)
+                workflow.add_edge(self._connect(workflow, fan_out_from, first_tier, sequential), "gate")
+
+                # The gate routes to the second tier's entry nodes, which then run as wired
+                second_tier_entry = second_tier[:1] if sequential else second_tier
+                workflow.add_conditional_edges(
+                    "gate",
+                    partial(self.route_after_gate, second_tier_entry),
+                    second_tier_entry + ["aggregate_results"]
+                )
+                for previous, node in zip(second_tier, second_tier[1:]) if sequential else []:
+                    workflow.add_edge(previous, node)
+                ends = second_tier[-1:] if sequential else second_tier
+            else:
+                ends = self._connect(workflow, fan_out_from, analysis_nodes, sequential)
+
+            for node in ends:
+                workflow.add_edge(node, "aggregate_results")
 
         # Connect aggregator to end
-        self.workflow.add_edge("aggregate_results", END)
+        workflow.add_edge("aggregate_results", END)
 
         # Compile workflow
-        self.app = self.workflow.compile()
-    
-    
+        return workflow.compile()
+
+    def _validate_execution(self, execution: str, max_in_flight: Optional[int]) -> Tuple[str, Optional[int]]:
+        """Check an execution strategy and its in-flight limit"""
+        if execution not in EXECUTION_STRATEGIES:
+            raise ValueError(f"execution must be one of {', '.join(EXECUTION_STRATEGIES)}")
+        if execution == "bounded":
+            if max_in_flight is None or max_in_flight < 1:
+                raise ValueError("Bounded execution needs max_in_flight of at least 1")
+            return execution, max_in_flight
+        return execution, None
+
+    def _runner(self, execution: Optional[str], max_in_flight: Optional[int]):
+        """Compiled graph and run config for a per-call strategy, defaulting to the agent's"""
+        if execution is None:
+            execution, max_in_flight = self.execution, self.max_in_flight
+        else:
+            execution, max_in_flight = self._validate_execution(execution, max_in_flight)
+        # Bounded execution caps the nodes LangGraph runs at once for one resume
+        config = {"max_concurrency": max_in_flight} if execution == "bounded" else {}
+        return self._graph(execution), config
+
+    def _validate_gating(self, gating: Dict) -> Dict:
+        """Check and normalize a gating configuration"""
+        first_tier = list(gating.get("first_tier", []))
+        unknown = [component for component in first_tier if component not in ANALYSIS_PROMPTS]
+        if not first_tier or unknown:
+            raise ValueError(f"Invalid gating first_tier: {first_tier}")
+        if len(first_tier) == len(ANALYSIS_PROMPTS):
+            raise ValueError("Gating first_tier must leave at least one component for the second tier")
+
+        threshold = float(gating.get("threshold", 0.0))
+        if not 0 <= threshold <= 100:
+            raise ValueError("Gating threshold must be between 0 and 100")
+        return {"first_tier": first_tier, "threshold": threshold}
+
     def get_model_info(self) -> Dict:
         """Get information about the currently used model"""
         return {
@@ -176,356 +603,455 @@ class ResumeAnalysisAgent:
             "pricing": self.model_manager.get_model_pricing(self.model_id)
         }
     
+    def get_call_stats(self) -> Dict:
+        """Rate limiter, adaptive concurrency and hedging statistics for this agent's model"""
+        return {
+            "rate_limiter": dict(self.rate_limiter.stats),
+            "concurrency": self.concurrency.stats() if self.concurrency is not None else None,
+            "hedging": self.hedger.stats() if self.hedger is not None else None
+        }
+
     def estimate_tokens(self, text: str) -> int:
-        """Estimate token count based on word count"""
-        return int(len(text.split()) * 0.9)
+        """Estimate token count with the local tokenizer"""
+        return count_tokens(text)
+
+    def _estimate_input_tokens(self, dimension: str, inputs: Dict[str, str]) -> int:
+        """Estimate prompt tokens without formatting the full prompt string"""
+        return self.prompt_tokens[dimension] + sum(count_tokens(text) for text in inputs.values())
+
+    def _token_usage(self, dimension: str, inputs: Dict[str, str], response: Dict) -> Dict:
+        """Token counts and cost for one call, preferring provider usage metadata"""
+        usage = usage_from_message(response["raw"])
+        if usage is not None:
+            usage["source"] = "provider"
+        else:
+            usage = {
+                "input_tokens": self._estimate_input_tokens(dimension, inputs),
+                "output_tokens": count_tokens(response["parsed"].model_dump_json()),
+                "source": "estimate"
+            }
+        usage["cost"] = calculate_cost(usage["input_tokens"], usage["output_tokens"], self.pricing)
+        return usage
 
-    def analyze_education(self, state: ResumeState):
-        """Analyze educational qualifications"""
-        structured_llm = self.llm.with_structured_output(EducationDetails)
-        
-        system_message = """You are a resume analyzer specializing in educational qualifications. 
-        Analyze the resume and provide scores and detailed explanations for educational components."""
-        
-        human_message = """Analyze these educational qualifications:
-        Job Description: {job_description}
-        Resume Content: {resume_content}
-        Provide:
-        1. Scores (0-100) for:
-           - Degree relevance to the position
-           - Education level match with requirements
-           - Academic achievements
-           - Relevant certifications
-        2. A detailed explanation of your analysis"""
+    def _invoke(self, chain, dimension: str, inputs: Dict[str, str],
+                trace: Optional[Dict] = None) -> Tuple[Dict, Dict]:
+        """Call a chain under the rate and concurrency limiters, returning (response, token_usage)
 
-        formatted_message = system_message + human_message.format(
-            job_description=state["job_description"],
-            resume_content=state["resume_content"]
+        Each attempt holds a concurrency slot; backoff between retries does
+        not. Call time, attempts and throttling are recorded in trace.
+        """
+        estimated_tokens = self._estimate_input_tokens(dimension, inputs) + EXPECTED_OUTPUT_TOKENS
+        call = chain.invoke if self.concurrency is None else partial(self.concurrency.run, chain.invoke)
+        call_stats = {}
+        start = time.perf_counter()
+        response = self.rate_limiter.call(call, inputs, estimated_tokens=estimated_tokens, call_stats=call_stats)
+        if trace is not None:
+            trace.update(llm_seconds=time.perf_counter() - start, **call_stats)
+        usage = self._token_usage(dimension, inputs, response)
+        self.rate_limiter.record_usage(estimated_tokens, usage["input_tokens"] + usage["output_tokens"])
+        return response, usage
+
+    async def _ainvoke(self, chain, dimension: str, inputs: Dict[str, str],
+                       trace: Optional[Dict] = None) -> Tuple[Dict, Dict]:
+        """Async variant of _invoke, hedging slow calls when enabled
+
+        Hedging sits inside the concurrency slot so it sees provider latency
+        rather than queueing time; a hedge shares its primary's slot and is
+        charged to the rate limiter. Only the winning response's usage is
+        reported.
+        """
+        estimated_tokens = self._estimate_input_tokens(dimension, inputs) + EXPECTED_OUTPUT_TOKENS
+        call = chain.ainvoke
+        if self.hedger is not None:
+            call = partial(
+                self.hedger.run, dimension, call,
+                on_hedge=partial(self.rate_limiter.charge, estimated_tokens)
+            )
+        if self.concurrency is not None:
+            call = partial(self.concurrency.arun, call)
+        call_stats = {}
+        start = time.perf_counter()
+        response = await self.rate_limiter.acall(
+            call, inputs, estimated_tokens=estimated_tokens, call_stats=call_stats
         )
-        input_tokens = self.estimate_tokens(formatted_message)
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message)
-        ])
-        result = prompt | structured_llm
-        output = result.invoke({
-            "job_description": state["job_description"],
-            "resume_content": state["resume_content"]
-        })
-
-        output_tokens = self.estimate_tokens(str(output.model_dump()))
-        scores = [
-            output.degree_relevance,
-            output.education_level,
-            output.academic_achievements,
-            output.certifications
-        ]
-        education_score = sum(scores) / len(scores)
-
+        if trace is not None:
+            trace.update(llm_seconds=time.perf_counter() - start, **call_stats)
+        usage = self._token_usage(dimension, inputs, response)
+        self.rate_limiter.record_usage(estimated_tokens, usage["input_tokens"] + usage["output_tokens"])
+        return response, usage
+
+    def _parse_response(self, response: Dict) -> BaseModel:
+        """Return the parsed structured output, raising if parsing failed"""
+        if response.get("parsing_error") is not None:
+            raise response["parsing_error"]
+        if response.get("parsed") is None:
+            raise ValueError("Model returned no structured output")
+        return response["parsed"]
+
+    def _analysis_inputs(self, dimension: str, state: ResumeState) -> Dict[str, str]:
+        """Prompt inputs for one dimension, routing only its resume sections when enabled"""
         return {
-            "education_score": education_score,
-            "analysis_details": {"education": output.model_dump()},
-            "total_input_tokens": input_tokens,
-            "total_output_tokens": output_tokens
+            "job_description": state.get("job_profile") or state["job_description"],
+            "resume_content": sections_for_component(
+                dimension, state.get("resume_sections", {}), state["resume_content"]
+            )
         }
 
-    def analyze_skills(self, state: ResumeState):
-        """Analyze skills"""
-        structured_llm = self.llm.with_structured_output(SkillsDetails)
-        
-        system_message = """You are a resume analyzer specializing in skills assessment."""
-        
-        human_message = """Analyze these skills:
-        Job Description: {job_description}
-        Resume Content: {resume_content}
-        Provide:
-        1. Scores (0-100) for:
-           - Technical skills match
-           - Soft skills match
-           - Tools and technologies proficiency
-           - Domain expertise
-        2. A detailed explanation of your analysis"""
+    def _cache_key(self, dimension: str, inputs: Dict[str, str]) -> Optional[str]:
+        """Build the cache key for one dimension's prompt inputs, if caching is enabled"""
+        if self.cache is None:
+            return None
+        config = self.model_manager.models_config[self.model_id]
+        return LLMResultCache.make_key(
+            config['model_id'], config['temperature'], PROMPT_VERSION, dimension,
+            inputs["job_description"], inputs["resume_content"]
+        )
 
-        formatted_message = system_message + human_message.format(
-            job_description=state["job_description"],
-            resume_content=state["resume_content"]
+    def _from_cache(self, key: Optional[str], details_model):
+        """Return a cached structured output, or None"""
+        if key is None:
+            return None
+        cached = self.cache.get(key)
+        return details_model(**cached) if cached is not None else None
+
+    def _to_cache(self, key: Optional[str], dimension: str, output: BaseModel):
+        """Store a structured output in the cache"""
+        if key is not None:
+            self.cache.put(key, output.model_dump(), dimension, PROMPT_VERSION)
+
+    def _prepare_analysis(self, dimension: str, state: ResumeState, trace: Dict):
+        """Prompt inputs, cache key and any cached output for one dimension"""
+        start = time.perf_counter()
+        inputs = self._analysis_inputs(dimension, state)
+        key = self._cache_key(dimension, inputs)
+        output = self._from_cache(key, self.details_models[dimension])
+        trace["prepare_seconds"] = time.perf_counter() - start
+        return inputs, key, output
+
+    def _finish_analysis(self, dimension: str, key: Optional[str], response: Dict,
+                         usage: Dict, trace: Dict) -> BaseModel:
+        """Check and cache a structured output, recording its tokens in trace"""
+        start = time.perf_counter()
+        output = self._parse_response(response)
+        self._to_cache(key, dimension, output)
+        trace.update(
+            postprocess_seconds=time.perf_counter() - start,
+            input_tokens=usage["input_tokens"],
+            output_tokens=usage["output_tokens"],
+            source=usage["source"]
         )
-        input_tokens = self.estimate_tokens(formatted_message)
+        return output
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message)
-        ])
-        result = prompt | structured_llm
-        output = result.invoke({
-            "job_description": state["job_description"],
-            "resume_content": state["resume_content"]
-        })
-
-        output_tokens = self.estimate_tokens(str(output.model_dump()))
-        scores = [
-            output.technical_skills,
-            output.soft_skills,
-            output.tools_tech,
-            output.domain_expertise
-        ]
-        skills_score = sum(scores) / len(scores)
+    def _run_analysis(self, dimension: str, state: ResumeState, trace: Optional[Dict] = None):
+        """Invoke the LLM for one dimension, returning (output, token_usage)
+
+        Cache hits cost no tokens. Stage timings are recorded in trace.
+        """
+        trace = {} if trace is None else trace
+        inputs, key, output = self._prepare_analysis(dimension, state, trace)
+        if output is not None:
+            trace["source"] = "cache"
+            return output, dict(CACHED_USAGE)
+
+        response, usage = self._invoke(self.chains[dimension], dimension, inputs, trace)
+        return self._finish_analysis(dimension, key, response, usage, trace), usage
+
+    async def _arun_analysis(self, dimension: str, state: ResumeState, trace: Optional[Dict] = None):
+        """Async variant of _run_analysis"""
+        trace = {} if trace is None else trace
+        inputs, key, output = self._prepare_analysis(dimension, state, trace)
+        if output is not None:
+            trace["source"] = "cache"
+            return output, dict(CACHED_USAGE)
+
+        response, usage = await self._ainvoke(self.chains[dimension], dimension, inputs, trace)
+        return self._finish_analysis(dimension, key, response, usage, trace), usage
+
+    @contextmanager
+    def _node_trace(self, node: str):
+        """Span around a graph node, yielding the trace dict later reported in final_analysis"""
+        trace = {}
+        start = time.perf_counter()
+        with tracer.span(node) as attributes:
+            try:
+                yield trace
+            finally:
+                trace["seconds"] = time.perf_counter() - start
+                attributes.update(trace)
+
+    def _call_timeout(self, state: ResumeState) -> Optional[float]:
+        """Seconds allowed for one call: the per-dimension timeout, capped by the resume deadline"""
+        limits = []
+        if self.timeouts.get('dimension_seconds'):
+            limits.append(self.timeouts['dimension_seconds'])
+        if state.get("deadline") is not None:
+            limits.append(state["deadline"] - time.monotonic())
+        return max(0.0, min(limits)) if limits else None
+
+    def _past_deadline(self, state: ResumeState) -> bool:
+        """Whether the resume deadline has already passed"""
+        return state.get("deadline") is not None and time.monotonic() >= state["deadline"]
+
+    def _timed_out_update(self, components) -> Dict:
+        """State update recording components that missed their deadline"""
+        return {"component_status": {component: "timed_out" for component in components}}
+
+    def _component_update(self, component: str, output: BaseModel, usage: Dict) -> Dict:
+        """Turn a structured output into the state update for one component"""
+        scores = [getattr(output, field) for field in COMPONENT_SCORE_FIELDS[component]]
 
         return {
-            "skills_score": skills_score,
-            "analysis_details": {"skills": output.model_dump()},
-            "total_input_tokens": input_tokens,
-            "total_output_tokens": output_tokens
+            f"{component}_score": sum(scores) / len(scores),
+            "analysis_details": {component: output.model_dump()},
+            "total_input_tokens": usage["input_tokens"],
+            "total_output_tokens": usage["output_tokens"],
+            "node_token_usage": {component: usage}
         }
 
-    def analyze_experience(self, state: ResumeState):
-        """Analyze experience"""
-        structured_llm = self.llm.with_structured_output(ExperienceDetails)
-        
-        system_message = """You are a resume analyzer specializing in work experience assessment."""
-        
-        human_message = """Analyze this work experience:
-        Job Description: {job_description}
-        Resume Content: {resume_content}
-        Provide:
-        1. Scores (0-100) for:
-           - Years of experience relevance
-           - Role relevance
-           - Industry fit
-           - Notable achievements
-        2. A detailed explanation of your analysis"""
-
-        formatted_message = system_message + human_message.format(
-            job_description=state["job_description"],
-            resume_content=state["resume_content"]
-        )
-        input_tokens = self.estimate_tokens(formatted_message)
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message)
-        ])
-        result = prompt | structured_llm
-        output = result.invoke({
-            "job_description": state["job_description"],
-            "resume_content": state["resume_content"]
-        })
-
-        output_tokens = self.estimate_tokens(str(output.model_dump()))
-        scores = [
-            output.years_experience,
-            output.role_relevance,
-            output.industry_fit,
-            output.achievements
-        ]
-        experience_score = sum(scores) / len(scores)
+    def _analyze_component(self, component: str, state: ResumeState):
+        """Run the analysis for a single component
 
+        A blocking call cannot be interrupted, so the sync path only skips
+        calls once the resume deadline has passed.
+        """
+        with self._node_trace(f"analyze_{component}") as trace:
+            if self._past_deadline(state):
+                update = self._timed_out_update([component])
+            else:
+                output, usage = self._run_analysis(component, state, trace)
+                update = self._component_update(component, output, usage)
+        return {**update, "node_traces": {component: trace}}
+
+    async def _aanalyze_component(self, component: str, state: ResumeState):
+        """Run the analysis for a single component without blocking the event loop"""
+        with self._node_trace(f"analyze_{component}") as trace:
+            try:
+                output, usage = await asyncio.wait_for(
+                    self._arun_analysis(component, state, trace), self._call_timeout(state)
+                )
+            except asyncio.TimeoutError:
+                update = self._timed_out_update([component])
+            else:
+                update = self._component_update(component, output, usage)
+        return {**update, "node_traces": {component: trace}}
+
+    def _job_profile_key(self, job_description: str) -> str:
+        return hashlib.sha256(job_description.encode('utf-8')).hexdigest()
+
+    def _job_profile_cache_key(self, job_description: str) -> Optional[str]:
+        """Persistent cache key for a job description's profile"""
+        return self._cache_key("job_profile", {"job_description": job_description, "resume_content": ""})
+
+    def _store_job_profile(self, job_description: str, profile: JobRequirementsProfile, usage: Dict) -> str:
+        """Remember a digested profile; its token usage is reported by the first resume to use it"""
+        text = render_job_profile(profile)
+        with self._job_profiles_lock:
+            self._job_profiles.setdefault(
+                self._job_profile_key(job_description),
+                {"text": text, "usage": usage, "reported": usage["source"] == "cache"}
+            )
+        return text
+
+    def _claim_job_profile(self, job_description: str) -> Tuple[str, Dict]:
+        """Profile text plus its token usage, which is non-zero only for its first consumer"""
+        with self._job_profiles_lock:
+            entry = self._job_profiles[self._job_profile_key(job_description)]
+            usage = dict(CACHED_USAGE) if entry["reported"] else entry["usage"]
+            entry["reported"] = True
+        return entry["text"], usage
+
+    def _cached_job_profile(self, job_description: str) -> Optional[str]:
+        """Profile text from memory or the persistent cache, or None"""
+        with self._job_profiles_lock:
+            entry = self._job_profiles.get(self._job_profile_key(job_description))
+        if entry is not None:
+            return entry["text"]
+
+        profile = self._from_cache(self._job_profile_cache_key(job_description), JobRequirementsProfile)
+        if profile is not None:
+            return self._store_job_profile(job_description, profile, dict(CACHED_USAGE))
+        return None
+
+    def digest_job_description(self, job_description: str, trace: Optional[Dict] = None) -> str:
+        """Condense a job description into a compact requirements profile, once per text"""
+        text = self._cached_job_profile(job_description)
+        if text is not None:
+            return text
+
+        inputs = {"job_description": job_description}
+        response, usage = self._invoke(self.job_profile_chain, "job_profile", inputs, trace)
+        profile = self._parse_response(response)
+        self._to_cache(self._job_profile_cache_key(job_description), "job_profile", profile)
+        return self._store_job_profile(job_description, profile, usage)
+
+    async def adigest_job_description(self, job_description: str, trace: Optional[Dict] = None) -> str:
+        """Async variant of digest_job_description"""
+        text = self._cached_job_profile(job_description)
+        if text is not None:
+            return text
+
+        inputs = {"job_description": job_description}
+        response, usage = await self._ainvoke(self.job_profile_chain, "job_profile", inputs, trace)
+        profile = self._parse_response(response)
+        self._to_cache(self._job_profile_cache_key(job_description), "job_profile", profile)
+        return self._store_job_profile(job_description, profile, usage)
+
+    def digest_job_description_node(self, state: ResumeState):
+        """Replace the raw job description in prompts with its requirements profile"""
+        with self._node_trace("digest_job_description") as trace:
+            if self._past_deadline(state):
+                return {"node_traces": {"job_profile": trace}}
+            self.digest_job_description(state["job_description"], trace)
+        return self._digest_update(state, trace)
+
+    async def adigest_job_description_node(self, state: ResumeState):
+        """Async variant of digest_job_description_node
+
+        If the digest misses its deadline, analyzers fall back to the raw job description.
+        """
+        with self._node_trace("digest_job_description") as trace:
+            try:
+                await asyncio.wait_for(
+                    self.adigest_job_description(state["job_description"], trace),
+                    self._call_timeout(state)
+                )
+            except asyncio.TimeoutError:
+                return {"node_traces": {"job_profile": trace}}
+        return self._digest_update(state, trace)
+
+    def _digest_update(self, state: ResumeState, trace: Dict):
+        """State update carrying the requirements profile and its one-time token cost"""
+        text, usage = self._claim_job_profile(state["job_description"])
         return {
-            "experience_score": experience_score,
-            "analysis_details": {"experience": output.model_dump()},
-            "total_input_tokens": input_tokens,
-            "total_output_tokens": output_tokens
+            "job_profile": text,
+            "total_input_tokens": usage["input_tokens"],
+            "total_output_tokens": usage["output_tokens"],
+            "node_token_usage": {"job_profile": usage},
+            "node_traces": {"job_profile": trace}
         }
 
-    def analyze_tools(self, state: ResumeState):
-        """Analyze tools proficiency"""
-        structured_llm = self.llm.with_structured_output(ToolsMatchDetails)
-        
-        system_message = """You are a resume analyzer specializing in tools and technology assessment."""
-        
-        human_message = """Analyze the tools match:
-        Job Description: {job_description}
-        Resume Content: {resume_content}
-        Provide:
-        1. Scores (0-100) for:
-           - Required tools proficiency
-           - Years of experience with tools
-           - Range of tools known
-           - Tool certifications
-        2. A detailed explanation of your analysis"""
+    def segment_resume(self, state: ResumeState):
+        """Split the resume into sections; empty when segmentation is unsure"""
+        return {"resume_sections": segment_resume(state["resume_content"])}
 
-        formatted_message = system_message + human_message.format(
-            job_description=state["job_description"],
-            resume_content=state["resume_content"]
-        )
-        input_tokens = self.estimate_tokens(formatted_message)
+    def analyze_education(self, state: ResumeState):
+        """Analyze educational qualifications"""
+        return self._analyze_component("education", state)
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message)
-        ])
-        result = prompt | structured_llm
-        output = result.invoke({
-            "job_description": state["job_description"],
-            "resume_content": state["resume_content"]
-        })
-
-        output_tokens = self.estimate_tokens(str(output.model_dump()))
-        scores = [
-            output.required_tools_proficiency,
-            output.tool_experience_years,
-            output.tool_diversity,
-            output.tool_certifications
-        ]
-        tools_score = sum(scores) / len(scores)
+    def analyze_skills(self, state: ResumeState):
+        """Analyze skills"""
+        return self._analyze_component("skills", state)
 
-        return {
-            "tools_score": tools_score,
-            "analysis_details": {"tools": output.model_dump()},
-            "total_input_tokens": input_tokens,
-            "total_output_tokens": output_tokens
-        }
+    def analyze_experience(self, state: ResumeState):
+        """Analyze experience"""
+        return self._analyze_component("experience", state)
+
+    def analyze_tools(self, state: ResumeState):
+        """Analyze tools proficiency"""
+        return self._analyze_component("tools", state)
 
     def analyze_industry(self, state: ResumeState):
         """Analyze industry fit"""
-        structured_llm = self.llm.with_structured_output(IndustryMatchDetails)
-        
-        system_message = """You are a resume analyzer specializing in industry assessment."""
-        
-        human_message = """Analyze the industry match:
-        Job Description: {job_description}
-        Resume Content: {resume_content}
-        Provide:
-        1. Scores (0-100) for:
-           - Industry experience
-           - Industry knowledge
-           - Industry projects
-           - Industry networking
-        2. A detailed explanation of your analysis"""
-
-        formatted_message = system_message + human_message.format(
-            job_description=state["job_description"],
-            resume_content=state["resume_content"]
-        )
-        input_tokens = self.estimate_tokens(formatted_message)
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message)
-        ])
-        result = prompt | structured_llm
-        output = result.invoke({
-            "job_description": state["job_description"],
-            "resume_content": state["resume_content"]
-        })
-
-        output_tokens = self.estimate_tokens(str(output.model_dump()))
-        scores = [
-            output.industry_experience,output.industry_experience,
-            output.industry_knowledge,
-            output.industry_projects,
-            output.industry_network
-        ]
-        industry_score = sum(scores) / len(scores)
-
-        return {
-            "industry_score": industry_score,
-            "analysis_details": {"industry": output.model_dump()},
-            "total_input_tokens": input_tokens,
-            "total_output_tokens": output_tokens
-        }
+        return self._analyze_component("industry", state)
 
     def analyze_role(self, state: ResumeState):
         """Analyze role match"""
-        structured_llm = self.llm.with_structured_output(RoleMatchDetails)
-        
-        system_message = """You are a resume analyzer specializing in role requirements."""
-        
-        human_message = """Analyze the role match:
-        Job Description: {job_description}
-        Resume Content: {resume_content}
-        Provide:
-        1. Scores (0-100) for:
-           - Role responsibilities
-           - Leadership requirements
-           - Project management
-           - Team collaboration
-        2. A detailed explanation of your analysis"""
-
-        formatted_message = system_message + human_message.format(
-            job_description=state["job_description"],
-            resume_content=state["resume_content"]
-        )
-        input_tokens = self.estimate_tokens(formatted_message)
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message)
-        ])
-        result = prompt | structured_llm
-        output = result.invoke({
-            "job_description": state["job_description"],
-            "resume_content": state["resume_content"]
-        })
-
-        output_tokens = self.estimate_tokens(str(output.model_dump()))
-        scores = [
-            output.role_responsibilities,
-            output.leadership_requirements,
-            output.project_management,
-            output.team_collaboration
-        ]
-        role_score = sum(scores) / len(scores)
-
-        return {
-            "role_score": role_score,
-            "analysis_details": {"role": output.model_dump()},
-            "total_input_tokens": input_tokens,
-            "total_output_tokens": output_tokens
-        }
+        return self._analyze_component("role", state)
 
     def analyze_preferences(self, state: ResumeState):
         """Analyze preferences match"""
-        structured_llm = self.llm.with_structured_output(PreferencesMatchDetails)
-        
-        system_message = """You are a resume analyzer specializing in preferences assessment."""
-        
-        human_message = """Analyze the preferences match:
-        Job Description: {job_description}
-        Resume Content: {resume_content}
-        Provide:
-        1. Scores (0-100) for:
-           - Work style compatibility
-           - Location preferences match
-           - Cultural fit indicators
-           - Growth potential
-        2. A detailed explanation of your analysis"""
-
-        formatted_message = system_message + human_message.format(
-            job_description=state["job_description"],
-            resume_content=state["resume_content"]
-        )
-        input_tokens = self.estimate_tokens(formatted_message)
+        return self._analyze_component("preferences", state)
+
+    def _fused_update(self, output: FusedAnalysisDetails, usage: Dict) -> Dict:
+        """Split a fused structured output into per-component state updates"""
+        # Score each dimension exactly as its dedicated node would
+        update = {
+            "analysis_details": {},
+            "total_input_tokens": usage["input_tokens"],
+            "total_output_tokens": usage["output_tokens"],
+            "node_token_usage": {"fused": usage}
+        }
+        for component, fields in COMPONENT_SCORE_FIELDS.items():
+            details = getattr(output, component)
+            scores = [getattr(details, field) for field in fields]
+            update[f"{component}_score"] = sum(scores) / len(scores)
+            update["analysis_details"][component] = details.model_dump()
+
+        return update
+
+    def analyze_all(self, state: ResumeState):
+        """Analyze all dimensions in a single structured call"""
+        with self._node_trace("analyze_all") as trace:
+            if self._past_deadline(state):
+                update = self._timed_out_update(ANALYSIS_PROMPTS)
+            else:
+                output, usage = self._run_analysis("fused", state, trace)
+                update = self._fused_update(output, usage)
+        return {**update, "node_traces": {"fused": trace}}
+
+    async def aanalyze_all(self, state: ResumeState):
+        """Analyze all dimensions in a single structured call without blocking the event loop"""
+        with self._node_trace("analyze_all") as trace:
+            try:
+                output, usage = await asyncio.wait_for(
+                    self._arun_analysis("fused", state, trace), self._call_timeout(state)
+                )
+            except asyncio.TimeoutError:
+                update = self._timed_out_update(ANALYSIS_PROMPTS)
+            else:
+                update = self._fused_update(output, usage)
+        return {**update, "node_traces": {"fused": trace}}
+
+    def gate(self, state: ResumeState):
+        """Screen out resumes whose weighted first-tier score is below the threshold
+
+        First-tier components that timed out are left out of the gate score.
+        """
+        tier_weights = {
+            component: state["weights"][component] for component in self.gating["first_tier"]
+            if component in state["analysis_details"]
+        }
+        total_weight = sum(tier_weights.values())
+        if total_weight <= 0:
+            # Nothing to judge the first tier by, so let the resume through
+            return {"screened_out": False, "gate_score": None}
+
+        gate_score = sum(
+            state[f"{component}_score"] * weight for component, weight in tier_weights.items()
+        ) / total_weight
+        return {"screened_out": gate_score < self.gating["threshold"], "gate_score": gate_score}
+
+    def route_after_gate(self, second_tier_entry: List[str], state: ResumeState):
+        """Skip straight to aggregation for screened-out resumes, otherwise enter the second tier"""
+        if state["screened_out"]:
+            return "aggregate_results"
+        return second_tier_entry
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message)
-        ])
-        result = prompt | structured_llm
-        output = result.invoke({
-            "job_description": state["job_description"],
-            "resume_content": state["resume_content"]
-        })
-
-        output_tokens = self.estimate_tokens(str(output.model_dump()))
-        scores = [
-            output.work_style,
-            output.location_match,
-            output.culture_fit,
-            output.growth_potential
-        ]
-        preferences_score = sum(scores) / len(scores)
+    def aggregate_results(self, state: ResumeState):
+        """Aggregate results from all analyses, attaching the run's trace"""
+        with self._node_trace("aggregate_results") as trace:
+            final_analysis = self._final_analysis(state)
+        final_analysis["trace"] = self._trace_summary(state, trace)
+        return {"final_analysis": final_analysis}
 
+    def _trace_summary(self, state: ResumeState, aggregate_trace: Dict) -> Dict:
+        """Run timings, LLM attempts and per-node traces for final_analysis"""
+        nodes = state.get("node_traces", {})
+        attempts = sum(trace.get("attempts", 0) for trace in nodes.values())
         return {
-            "preferences_score": preferences_score,
-            "analysis_details": {"preferences": output.model_dump()},
-            "total_input_tokens": input_tokens,
-            "total_output_tokens": output_tokens
+            "trace_id": current_trace_id(),
+            "total_seconds": time.monotonic() - state["started_at"],
+            "aggregate_seconds": aggregate_trace["seconds"],
+            "llm_seconds": sum(trace.get("llm_seconds", 0.0) for trace in nodes.values()),
+            "throttled_seconds": sum(trace.get("throttled_seconds", 0.0) for trace in nodes.values()),
+            "llm_calls": sum(1 for trace in nodes.values() if trace.get("attempts")),
+            "retries": sum(max(trace.get("attempts", 0) - 1, 0) for trace in nodes.values()),
+            "attempts": attempts,
+            "nodes": nodes
         }
 
-    def aggregate_results(self, state: ResumeState):
-        """Aggregate results from all analyses"""
+    def _final_analysis(self, state: ResumeState) -> Dict:
+        """Weighted total, component scores and token usage from the finished state"""
         # Get weights from state
         weights = state["weights"]
         
@@ -535,7 +1061,8 @@ class ResumeAnalysisAgent:
 
         for component, weight in weights.items():
             score_key = f"{component}_score"
-            if score_key in state and state[score_key] is not None:
+            # Components skipped by gating have no details and are left out
+            if component in state["analysis_details"] and state.get(score_key) is not None:
                 # Convert percentage to decimal for calculation
                 score = state[score_key] / 100.0  # Convert percentage to decimal
                 weighted_sum += score * weight
@@ -544,6 +1071,13 @@ class ResumeAnalysisAgent:
         # Calculate final score as percentage
         total_score = (weighted_sum / available_weight * 100) if available_weight > 0 else 0.0
 
+        # Components were completed, timed out, or skipped by gating
+        statuses = {
+            component: "completed" if component in state["analysis_details"]
+            else state.get("component_status", {}).get(component, "skipped")
+            for component in weights.keys()
+        }
+
         # Include weights in the final analysis
         final_analysis = {
             "total_score": total_score,
@@ -551,7 +1085,8 @@ class ResumeAnalysisAgent:
                 component: {
                     "score": state[f"{component}_score"],
                     "weight": weights[component],  # Include weight in output
-                    "details": state["analysis_details"].get(component, {})
+                    "details": state["analysis_details"].get(component, {}),
+                    "status": statuses[component]
                 }
                 for component in weights.keys()
                 if f"{component}_score" in state
@@ -562,36 +1097,39 @@ class ResumeAnalysisAgent:
                 if component in state["analysis_details"]
             },
             "weights_used": weights,  # Include the weights used in analysis
+            "screened_out": state.get("screened_out", False),
+            "gate_score": state.get("gate_score"),
+            # False when any component missed its deadline and the total covers only the rest
+            "complete": "timed_out" not in statuses.values(),
             "token_usage": {
                 "input_tokens": state["total_input_tokens"],
-                "output_tokens": state["total_output_tokens"]
+                "output_tokens": state["total_output_tokens"],
+                "cost": sum(usage["cost"] for usage in state["node_token_usage"].values()),
+                "by_node": state["node_token_usage"]
             }
         }
 
-        return {"final_analysis": final_analysis}
+        return final_analysis
 
-    def analyze_resume(self, job_description: str, resume_content: str, weights: Optional[Dict[str, float]] = None) -> dict:
-        """Main method to analyze a resume against a job description"""
-        # Use provided weights or default weights
-        default_weights = {
-            "education": 0.15,
-            "skills": 0.20,
-            "experience": 0.20,
-            "tools": 0.15,
-            "industry": 0.10,
-            "role": 0.15,
-            "preferences": 0.05
-        }
-        
-        analysis_weights = weights if weights is not None else default_weights
+    def _initial_state(self, job_description: str, resume_content: str,
+                       weights: Optional[Dict[str, float]] = None) -> ResumeState:
+        """Build the initial graph state, using default weights if none are given"""
+        analysis_weights = weights if weights is not None else DEFAULT_WEIGHTS
         
         # Validate weights
         if abs(sum(analysis_weights.values()) - 1.0) > 0.0001:
             raise ValueError("Weights must sum to 1.0")
+
+        # The resume deadline starts when its analysis does, not when it is queued
+        resume_seconds = self.timeouts.get('resume_seconds')
         
-        initial_state = ResumeState(
+        return ResumeState(
             job_description=job_description,
             resume_content=resume_content,
+            resume_sections={},
+            job_profile="",
+            screened_out=False,
+            gate_score=None,
             education_score=0.0,
             skills_score=0.0,
             experience_score=0.0,
@@ -600,18 +1138,93 @@ class ResumeAnalysisAgent:
             role_score=0.0,
             preferences_score=0.0,
             analysis_details={},
+            component_status={},
+            deadline=time.monotonic() + resume_seconds if resume_seconds else None,
             total_input_tokens=0,
             total_output_tokens=0,
+            node_token_usage={},
+            node_traces={},
+            started_at=time.monotonic(),
             final_analysis={},
             weights=analysis_weights  # Add the weights to the initial state
         )
 
+    def analyze_resume(self, job_description: str, resume_content: str, weights: Optional[Dict[str, float]] = None,
+                       execution: Optional[str] = None, max_in_flight: Optional[int] = None) -> dict:
+        """Main method to analyze a resume against a job description
+
+        execution and max_in_flight override the agent's strategy for this call.
+        """
+        initial_state = self._initial_state(job_description, resume_content, weights)
+        graph, config = self._runner(execution, max_in_flight)
+
         try:
-            final_state = self.app.invoke(initial_state)
+            with tracer.span("analyze_resume", execution=execution or self.execution):
+                final_state = graph.invoke(initial_state, config)
             return final_state["final_analysis"]
         except Exception as e:
             print(f"Error in analyze_resume: {str(e)}")
             raise
+
+    async def analyze_resume_async(self, job_description: str, resume_content: str,
+                                   weights: Optional[Dict[str, float]] = None,
+                                   execution: Optional[str] = None,
+                                   max_in_flight: Optional[int] = None) -> dict:
+        """Analyze a resume against a job description using the graph's ainvoke"""
+        initial_state = self._initial_state(job_description, resume_content, weights)
+        graph, config = self._runner(execution, max_in_flight)
+
+        try:
+            with tracer.span("analyze_resume", execution=execution or self.execution):
+                final_state = await graph.ainvoke(initial_state, config)
+            return final_state["final_analysis"]
+        except Exception as e:
+            print(f"Error in analyze_resume_async: {str(e)}")
+            raise
+
+    async def analyze_batch(self, job_description: str, resumes: Dict[str, str],
+                            weights: Optional[Dict[str, float]] = None,
+                            max_concurrency: int = 10,
+                            on_error: Optional[Callable[[str, Exception], None]] = None
+                            ) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        Analyze many resumes concurrently, yielding (resume_id, analysis) pairs
+        in completion order. At most max_concurrency resumes are in flight.
+        If on_error is given, a resume that still fails after retries is
+        reported to it and skipped instead of aborting the batch.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Digest the shared job description once rather than racing on it per resume
+        if self.job_digest:
+            await self.adigest_job_description(job_description)
+
+        async def run(resume_id: str, resume_content: str) -> Tuple[str, Optional[dict]]:
+            async with semaphore:
+                try:
+                    analysis = await self.analyze_resume_async(job_description, resume_content, weights)
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    on_error(resume_id, e)
+                    analysis = None
+                return resume_id, analysis
+
+        tasks = [
+            asyncio.create_task(run(resume_id, resume_content))
+            for resume_id, resume_content in resumes.items()
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                resume_id, analysis = await next_done
+                if analysis is not None:
+                    yield resume_id, analysis
+        finally:
+            # Stop outstanding work if the consumer stops early or a resume fails
+            for task in tasks:
+                task.cancel()
     
 
     def validate_weights(self, weights: Dict[str, float]) -> bool:
@@ -0,0 +1,96 @@
+import re
+from typing import Dict, List, Optional
+
+# Heading keywords for each section, checked in order so that e.g.
+# "Skills Summary" is read as skills rather than summary
+SECTION_KEYWORDS = {
+    "experience": ["experience", "employment", "work history", "career history", "professional history"],
+    "education": ["education", "academic", "qualifications", "academics"],
+    "certifications": ["certification", "certificates", "licenses", "licences", "accreditations"],
+    "skills": ["skills", "competencies", "technologies", "technical proficiencies", "tools", "expertise"],
+    "summary": ["summary", "profile", "objective", "about me", "overview"],
+}
+
+# Sections each analysis component needs; "header" is the text above the first
+# heading, which usually holds contact details and location
+COMPONENT_SECTIONS = {
+    "education": ["education", "certifications"],
+    "skills": ["summary", "skills", "experience"],
+    "experience": ["summary", "experience"],
+    "tools": ["skills", "experience", "certifications"],
+    "industry": ["summary", "experience"],
+    "role": ["summary", "experience"],
+    "preferences": ["header", "summary"],
+}
+
+MAX_HEADING_WORDS = 4
+MIN_SECTIONS = 2
+MIN_SECTION_COVERAGE = 0.5
+
+_BULLETS = re.compile(r"^[\s\-\u2022\u25aa\u25cf*#|]+|[\s:\-|]+$")
+
+
+def _match_heading(line: str) -> Optional[tuple]:
+    """Return (section, trailing_text) if the line looks like a section heading"""
+    stripped = _BULLETS.sub("", line)
+    if not stripped:
+        return None
+
+    # Inline headings such as "Skills: Python, SQL"
+    heading, colon, remainder = stripped.partition(":")
+    words = heading.split()
+    if not words or len(words) > MAX_HEADING_WORDS or heading.rstrip().endswith("."):
+        return None
+
+    # Headings are capitalized or end in a colon; "5 years experience" is body text
+    if not (colon or line.rstrip().endswith(":") or heading.isupper() or heading.istitle()):
+        return None
+
+    normalized = " ".join(words).lower()
+    for section, keywords in SECTION_KEYWORDS.items():
+        if any(keyword in normalized for keyword in keywords):
+            return section, remainder.strip()
+    return None
+
+
+def segment_resume(text: str) -> Dict[str, str]:
+    """Split resume text into education, experience, skills, certifications and summary
+
+    Returns an empty dict when segmentation is unsure (too few headings found,
+    or most of the text falls outside recognized sections), so callers fall
+    back to the full text.
+    """
+    lines: Dict[str, List[str]] = {"header": []}
+    current = "header"
+    for line in text.splitlines():
+        match = _match_heading(line)
+        if match is not None:
+            current, remainder = match
+            lines.setdefault(current, [])
+            if remainder:
+                lines[current].append(remainder)
+        else:
+            lines[current].append(line)
+
+    sections = {name: "\n".join(body).strip() for name, body in lines.items()}
+    sections = {name: body for name, body in sections.items() if body or name == "header"}
+
+    recognized = [name for name in sections if name != "header"]
+    recognized_chars = sum(len(sections[name]) for name in recognized)
+    total_chars = recognized_chars + len(sections["header"])
+    if len(recognized) < MIN_SECTIONS or not total_chars or recognized_chars / total_chars < MIN_SECTION_COVERAGE:
+        return {}
+    return sections
+
+
+def sections_for_component(component: str, sections: Dict[str, str], full_text: str) -> str:
+    """Resume text relevant to one component, or the full text if its sections are missing"""
+    if not sections:
+        return full_text
+
+    parts = [
+        f"{name.upper()}:\n{sections[name]}"
+        for name in COMPONENT_SECTIONS.get(component, [])
+        if sections.get(name)
+    ]
+    return "\n\n".join(parts) if parts else full_text
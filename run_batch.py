@@ -0,0 +1,155 @@
+"""Headless batch runner: analyze a directory of resumes without the Streamlit UI.
+
+Usage:
+    python run_batch.py --jd job.pdf --resumes resumes/ --output results.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from extraction_cache import open_extraction_cache
+from file_utils import FileReadError, read_file_content, read_files
+from lexical_ranker import shortlist
+from resume_analysis_agent import ResumeAnalysisAgent
+from cascade import CascadeAnalyzer
+from model_manager import ModelManager
+from tracing import configure_tracing
+
+
+async def run(args) -> list:
+    """Analyze every resume concurrently and return results sorted by score"""
+    model_manager = ModelManager()
+    configure_tracing(model_manager.get_tracing_config())
+    extraction_config = model_manager.get_extraction_config()
+    extraction_cache = open_extraction_cache(extraction_config)
+
+    # Files cut short by the extraction limits, flagged in their results
+    truncated = {}
+
+    def on_truncated(path, limit):
+        truncated[os.path.basename(path)] = limit
+        print(f"Truncated {os.path.basename(path)} at its {limit} limit", file=sys.stderr)
+
+    try:
+        job_description = read_file_content(
+            args.jd,
+            cache=extraction_cache,
+            pdf_backend=extraction_config.get('pdf_backend', 'auto'),
+            limits=extraction_config.get('limits'),
+            on_truncated=on_truncated
+        )
+    except FileReadError as e:
+        raise SystemExit(f"Could not read job description {args.jd}: {e}")
+    if not job_description:
+        raise SystemExit(f"Could not read job description: {args.jd}")
+
+    # Parse resumes in worker processes, reusing text cached from earlier runs
+    contents = read_files(
+        [os.path.join(args.resumes, file_name) for file_name in sorted(os.listdir(args.resumes))],
+        cache=extraction_cache,
+        max_workers=extraction_config.get('workers'),
+        on_error=lambda path, e: print(f"Skipping {os.path.basename(path)}: {e}", file=sys.stderr),
+        pdf_backend=extraction_config.get('pdf_backend', 'auto'),
+        limits=extraction_config.get('limits'),
+        on_truncated=on_truncated
+    )
+    resumes = {os.path.basename(path): content for path, content in contents.items() if content}
+
+    # Optionally keep only the best lexical matches for LLM analysis
+    lexical_scores = {}
+    if args.top_k is not None or args.min_lexical_score is not None:
+        lexical_scores = dict(shortlist(
+            resumes, job_description, top_k=args.top_k, min_score=args.min_lexical_score
+        ))
+        print(f"Pre-screening kept {len(lexical_scores)} of {len(resumes)} resumes")
+        resumes = {name: resumes[name] for name in lexical_scores}
+
+    gating = None
+    if args.gating_threshold is not None:
+        gating = {**model_manager.get_gating_config(), "threshold": args.gating_threshold}
+
+    if args.cascade:
+        agent = CascadeAnalyzer.from_config(
+            model_manager=model_manager,
+            section_routing=args.section_routing,
+            job_digest=args.job_digest,
+            gating=gating
+        )
+    else:
+        agent = ResumeAnalysisAgent(
+            args.model,
+            fused=args.fused,
+            section_routing=args.section_routing,
+            job_digest=args.job_digest,
+            gating=gating,
+            execution=args.execution,
+            max_in_flight=args.max_in_flight
+        )
+    results = []
+    def on_error(file_name, error):
+        print(f"Failed {file_name}: {error}", file=sys.stderr)
+
+    async for file_name, analysis in agent.analyze_batch(
+        job_description, resumes, max_concurrency=args.max_concurrency, on_error=on_error
+    ):
+        analysis['file_name'] = file_name
+        if file_name in truncated:
+            analysis['truncated'] = truncated[file_name]
+        if file_name in lexical_scores:
+            analysis['lexical_score'] = lexical_scores[file_name]
+        results.append(analysis)
+        print(f"[{len(results)}/{len(resumes)}] {file_name}: {analysis['total_score']:.1f}%")
+
+    concurrency = getattr(agent, 'concurrency', None)
+    if concurrency is not None:
+        stats = concurrency.stats()
+        print(f"Concurrency window: {stats['window']} (peak {stats['peak_in_flight']} in flight, "
+              f"{stats['congestion_events']} congestion events)")
+    hedger = getattr(agent, 'hedger', None)
+    if hedger is not None:
+        stats = hedger.stats()
+        print(f"Hedged requests: {stats['hedges']} of {stats['calls']} calls "
+              f"({stats['hedge_wins']} won, {stats['budget_exhausted']} skipped over budget)")
+
+    results.sort(key=lambda x: x['total_score'], reverse=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze resumes against a job description")
+    parser.add_argument("--jd", required=True, help="Job description file")
+    parser.add_argument("--resumes", required=True, help="Directory of resume files")
+    parser.add_argument("--output", default="analysis_results.json", help="Output JSON file")
+    parser.add_argument("--model", default=None, help="Model ID from config.yaml")
+    parser.add_argument("--fused", action="store_true", help="Score all dimensions in one call")
+    parser.add_argument("--section-routing", action="store_true",
+                        help="Send each analyzer only the resume sections it needs")
+    parser.add_argument("--job-digest", action="store_true",
+                        help="Condense the job description once into a requirements profile")
+    parser.add_argument("--gating-threshold", type=float, default=None,
+                        help="Skip remaining components when the first-tier score "
+                             "(from config.yaml gating) is below this")
+    parser.add_argument("--cascade", action="store_true",
+                        help="Use the screening/premium model cascade from config.yaml")
+    parser.add_argument("--top-k", type=int, default=None,
+                        help="Only analyze the K best lexical matches")
+    parser.add_argument("--min-lexical-score", type=float, default=None,
+                        help="Only analyze resumes scoring at least this (0-100) lexically")
+    parser.add_argument("--execution", choices=["parallel", "sequential", "bounded"], default="parallel",
+                        help="How each resume's dimensions run")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="Dimensions analyzed at once per resume with --execution bounded")
+    parser.add_argument("--max-concurrency", type=int, default=10,
+                        help="Maximum number of resumes analyzed at once")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
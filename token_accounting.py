@@ -0,0 +1,55 @@
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:  # tiktoken is optional; fall back to a character heuristic
+    _ENCODING = None
+
+
+@lru_cache(maxsize=256)
+def count_tokens(text: str) -> int:
+    """Count tokens locally, for when the provider reports no usage metadata
+
+    Uses tiktoken's cl100k_base encoding when installed, otherwise roughly
+    four characters per token, which holds up better than word counts for
+    code-heavy and non-English text. Memoized since the same job description
+    and resume recur in every node.
+    """
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return math.ceil(len(text) / 4)
+
+
+def usage_from_message(message) -> Optional[Dict[str, int]]:
+    """Extract provider-reported token usage from a chat model response"""
+    usage = getattr(message, 'usage_metadata', None)
+    if not usage:
+        return None
+    return {
+        "input_tokens": int(usage.get('input_tokens', 0)),
+        "output_tokens": int(usage.get('output_tokens', 0))
+    }
+
+
+def calculate_cost(input_tokens: int, output_tokens: int, pricing: Dict[str, float]) -> float:
+    """Cost in dollars, given pricing per million input/output tokens"""
+    return (input_tokens * pricing.get('input', 0.0) + output_tokens * pricing.get('output', 0.0)) / 1_000_000
+
+
+def summarize_token_usage(analyzed_results: List[Dict]) -> Dict:
+    """Total tokens and cost across a batch of analyses"""
+    totals = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0, "resumes": 0}
+    for result in analyzed_results:
+        usage = result.get('token_usage')
+        if not usage:
+            continue
+        totals["input_tokens"] += usage.get('input_tokens', 0)
+        totals["output_tokens"] += usage.get('output_tokens', 0)
+        totals["cost"] += usage.get('cost', 0.0)
+        totals["resumes"] += 1
+    return totals